@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+ARCSEC Common v3.0X
+Helpers shared by the ARCSEC utilities
+© 2025 Daniel Guzman - All Rights Reserved
+Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
+"""
+
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+def file_extension(name: str) -> str:
+    """Final suffix of a file name, matching PurePath.suffix without building a path"""
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+def json_decode(raw: Union[bytes, str]) -> Tuple[Any, bool]:
+    """Decode JSON, preferring orjson when available; the flag is True if orjson decoded it"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            # NaN, Infinity, integers wider than 64 bits and lone surrogates are
+            # only accepted by the stdlib; truly invalid input raises its error below
+            pass
+    return json.loads(raw), False
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    """Decode JSON, preferring orjson when available"""
+    return json_decode(raw)[0]
+
+def _orjson_options(default: Optional[Callable[[Any], Any]]) -> int:
+    """orjson options matching the stdlib encoder: int keys allowed, dataclasses sent to default"""
+    option = orjson.OPT_NON_STR_KEYS
+    if default is not None:
+        option |= orjson.OPT_PASSTHROUGH_DATACLASS
+    return option
+
+def json_dumps(data: Any, default: Optional[Callable[[Any], Any]] = None,
+               use_orjson: bool = True) -> bytes:
+    """Encode data as indented UTF-8 JSON bytes, preferring orjson when available"""
+    if orjson is not None and use_orjson:
+        try:
+            return orjson.dumps(data, default=default,
+                                option=_orjson_options(default) | orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # Deeper nesting or wider integers than orjson supports
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+
+def json_line(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode data as one compact, newline-terminated JSON line"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=default,
+                                option=_orjson_options(default) | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(data, ensure_ascii=False, default=default) + "\n").encode('utf-8')
@@ -7,19 +7,72 @@ Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
 """
 
 import os
+import io
 import json
 import yaml
 import csv
 import xml.etree.ElementTree as ET
 import base64
+import binascii
 import hashlib
+import contextlib
+import operator
+import stat
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, ClassVar, Dict, List, Any, Mapping, Optional, Union
 import subprocess
-import tempfile
+
+from arcsec_common import json_dumps, json_loads
+
+try:
+    from yaml import CSafeLoader as _YAMLLoader, CSafeDumper as _YAMLDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader, SafeDumper as _YAMLDumper
 
 class ARCSECConverter:
+    # Output file extension per conversion type
+    _EXT_MAP: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'json_to_yaml': '.yml',
+        'yaml_to_json': '.json',
+        'csv_to_json': '.json',
+        'json_to_csv': '.csv',
+        'xml_to_json': '.json',
+        'json_to_xml': '.xml',
+        'legacy_to_arcsec': '.json',
+        'arcsec_to_standard': '.json',
+        'base64_encode': '.b64',
+        'base64_decode': '.bin',
+        'binary_to_hex': '.hex',
+        'hex_to_binary': '.bin'
+    })
+    
+    # Human-readable description per conversion type
+    _DESCRIPTIONS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'json_to_yaml': 'Convert JSON to YAML format',
+        'yaml_to_json': 'Convert YAML to JSON format',
+        'csv_to_json': 'Convert CSV to JSON format',
+        'json_to_csv': 'Convert JSON to CSV format',
+        'xml_to_json': 'Convert XML to JSON format',
+        'json_to_xml': 'Convert JSON to XML format',
+        'legacy_to_arcsec': 'Convert legacy format to ARCSEC-compliant format',
+        'arcsec_to_standard': 'Convert ARCSEC format to standard format',
+        'base64_encode': 'Encode binary data to base64',
+        'base64_decode': 'Decode base64 to binary data',
+        'binary_to_hex': 'Convert binary data to hexadecimal',
+        'hex_to_binary': 'Convert hexadecimal to binary data'
+    })
+    
+    # Identity conversions: convert_file writes the parsed input out directly
+    # instead of calling their converter
+    _PASSTHROUGH_CONVERSIONS: ClassVar[frozenset] = frozenset({'yaml_to_json', 'csv_to_json'})
+    
     def __init__(self):
         self.digital_signature = "a6672edf248c5eeef3054ecca057075c938af653"
         self.creator = "Daniel Guzman"
@@ -27,6 +80,17 @@ class ARCSECConverter:
         self.last_updated = "2025-07-30T20:00:00Z"
         self.protection_level = "WAR_MODE_MAXIMUM"
         
+        # Stable ARCSEC metadata; only the conversion timestamp varies per call
+        self._arcsec_template = {
+            "version": self.version,
+            "creator": self.creator,
+            "copyright": f"© 2025 {self.creator} - All Rights Reserved",
+            "digital_signature": self.digital_signature,
+            "converted": None,
+            "protection_level": "ARCSEC_PROTECTED",
+            "conversion_source": "legacy_format"
+        }
+        
         # Supported conversions
         self.conversions = {
             'json_to_yaml': self.json_to_yaml,
@@ -43,6 +107,32 @@ class ARCSECConverter:
             'hex_to_binary': self.hex_to_binary
         }
         
+        # Binary encodings are streamed chunk-by-chunk so memory stays flat
+        # regardless of input size; align keeps each chunk a whole encoding group
+        self.stream_chunk_size = 48 * 1024
+        self.stream_buffer_size = 1 << 20
+        self.streaming_conversions = {
+            'base64_encode': partial(self._fused_convert, transform=base64.b64encode, align=3),
+            'base64_decode': partial(self._fused_convert, transform=base64.b64decode,
+                                     align=4, strip_whitespace=True),
+            'binary_to_hex': partial(self._fused_convert, transform=binascii.hexlify),
+            'hex_to_binary': partial(self._fused_convert, transform=binascii.unhexlify,
+                                     align=2, strip_whitespace=True)
+        }
+        
+        # Checksums read into a reusable buffer instead of a new bytes per chunk;
+        # each thread gets its own so concurrent checksums cannot clobber it
+        self._hash_buffers = threading.local()
+        
+        # Conversion timestamps are reused for up to timestamp_ttl seconds
+        self.timestamp_ttl = 0.25
+        self._timestamp_cache = (float('-inf'), "")
+        
+        # Batches of at least prefetch_min_files keep this many inputs hinted
+        # to the kernel ahead of the workers, so cold-cache reads overlap
+        self.prefetch_window = 32
+        self.prefetch_min_files = 16
+        
         print(f"🔄 ARCSEC Converter v{self.version} - INITIALIZING")
         print(f"🛡️  Digital Signature: {self.digital_signature}")
         print(f"👨‍💻 Creator: {self.creator}")
@@ -64,15 +154,26 @@ class ARCSECConverter:
                     "error": f"Unsupported conversion type: {conversion_type}"
                 }
             
-            # Read input file
-            input_data = self.read_input_file(input_path, conversion_type)
-            
-            # Perform conversion
-            converter_func = self.conversions[conversion_type]
-            converted_data = converter_func(input_data, options)
+            # One stat serves both the existence check and the input size
+            input_stat = self._stat(input_path)
+            if input_stat is None:
+                raise FileNotFoundError(f"Input file not found: {input_path}")
             
-            # Write output file
-            self.write_output_file(output_path, converted_data, conversion_type)
+            if conversion_type in self.streaming_conversions:
+                # Stream directly from input to output without buffering the file
+                self.streaming_conversions[conversion_type](input_path, output_path)
+            else:
+                # Read input file
+                input_data = self.read_input_file(input_path, conversion_type)
+                
+                # Perform conversion
+                if conversion_type not in self._PASSTHROUGH_CONVERSIONS:
+                    converter_func = self.conversions[conversion_type]
+                    # The parsed input belongs to this call, so it may be modified in place
+                    input_data = converter_func(input_data, {**options, "in_place": True})
+                
+                # Write output file
+                self.write_output_file(output_path, input_data, conversion_type)
             
             # Calculate checksums
             input_checksum = self.calculate_file_checksum(input_path)
@@ -83,12 +184,12 @@ class ARCSECConverter:
                 "input_path": input_path,
                 "output_path": output_path,
                 "conversion_type": conversion_type,
-                "input_size": os.path.getsize(input_path),
-                "output_size": os.path.getsize(output_path),
+                "input_size": input_stat.st_size,
+                "output_size": os.stat(output_path).st_size,
                 "input_checksum": input_checksum,
                 "output_checksum": output_checksum,
                 "conversion_metadata": {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": self._timestamp(),
                     "converter_version": self.version,
                     "digital_signature": self.digital_signature
                 }
@@ -110,26 +211,43 @@ class ARCSECConverter:
             print(f"❌ Conversion failed: {str(e)}")
             return error_result
     
+    def _stat(self, filepath: str) -> Optional[os.stat_result]:
+        """Stat a path, returning None if it does not exist"""
+        try:
+            return os.stat(filepath)
+        except OSError:
+            return None
+    
+    def _timestamp(self) -> str:
+        """Current UTC ISO timestamp, cached for timestamp_ttl seconds"""
+        now = time.monotonic()
+        cached_at, stamp = self._timestamp_cache
+        if now - cached_at > self.timestamp_ttl:
+            stamp = datetime.now(timezone.utc).isoformat()
+            self._timestamp_cache = (now, stamp)
+        return stamp
+    
     def read_input_file(self, filepath: str, conversion_type: str) -> Any:
-        """Read input file based on conversion type"""
-        if not os.path.exists(filepath):
-            raise FileNotFoundError(f"Input file not found: {filepath}")
+        """Read input file based on conversion type
         
-        if conversion_type.startswith('json_'):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        A missing file surfaces as FileNotFoundError when it is opened.
+        """
+        if conversion_type.startswith('xml_'):
+            # Return the path so xml_to_json can stream-parse it
+            return filepath
+        
+        elif conversion_type.startswith('json_'):
+            with open(filepath, 'rb') as f:
+                return json_loads(f.read())
         
         elif conversion_type.startswith('yaml_'):
             with open(filepath, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YAMLLoader)
         
         elif conversion_type.startswith('csv_'):
             with open(filepath, 'r', encoding='utf-8') as f:
                 return list(csv.DictReader(f))
         
-        elif conversion_type.startswith('xml_'):
-            return ET.parse(filepath).getroot()
-        
         elif conversion_type in ['base64_encode', 'binary_to_hex']:
             with open(filepath, 'rb') as f:
                 return f.read()
@@ -145,19 +263,32 @@ class ARCSECConverter:
             os.makedirs(output_dir, exist_ok=True)
         
         if conversion_type.endswith('_to_json') or conversion_type == 'legacy_to_arcsec':
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(data))
         
         elif conversion_type.endswith('_to_yaml'):
             with open(filepath, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(data, f, Dumper=_YAMLDumper, default_flow_style=False, allow_unicode=True)
         
         elif conversion_type.endswith('_to_csv'):
             with open(filepath, 'w', encoding='utf-8', newline='') as f:
                 if isinstance(data, list) and data:
-                    writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(data)
+                    fieldnames = list(data[0].keys())
+                    header = data[0].keys()
+                    if fieldnames and all(isinstance(row, dict) and row.keys() == header for row in data):
+                        # Uniform schema: write rows positionally, skipping
+                        # DictWriter's per-row key reflection and checks
+                        getter = operator.itemgetter(*fieldnames)
+                        writer = csv.writer(f)
+                        writer.writerow(fieldnames)
+                        if len(fieldnames) > 1:
+                            writer.writerows(map(getter, data))
+                        else:
+                            writer.writerows((getter(row),) for row in data)
+                    else:
+                        writer = csv.DictWriter(f, fieldnames=fieldnames)
+                        writer.writeheader()
+                        writer.writerows(data)
         
         elif conversion_type.endswith('_to_xml'):
             tree = ET.ElementTree(data)
@@ -174,7 +305,7 @@ class ARCSECConverter:
     # Conversion functions
     def json_to_yaml(self, data: Dict[str, Any], options: Dict[str, Any]) -> str:
         """Convert JSON to YAML"""
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(data, Dumper=_YAMLDumper, default_flow_style=False, allow_unicode=True)
     
     def yaml_to_json(self, data: Any, options: Dict[str, Any]) -> Dict[str, Any]:
         """Convert YAML to JSON"""
@@ -194,42 +325,96 @@ class ARCSECConverter:
         else:
             raise ValueError("JSON data must be a dictionary or list of dictionaries for CSV conversion")
     
-    def xml_to_json(self, root: ET.Element, options: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert XML to JSON"""
-        def xml_element_to_dict(element):
-            result = {}
-            
-            # Add attributes
-            if element.attrib:
-                result['@attributes'] = element.attrib
-            
-            # Add text content
-            if element.text and element.text.strip():
-                if len(element) == 0:  # No children, just text
-                    return element.text
-                else:
-                    result['#text'] = element.text.strip()
-            
-            # Add children
-            for child in element:
-                child_data = xml_element_to_dict(child)
+    def xml_to_json(self, root: Union[ET.Element, str], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert XML to JSON (a file path is stream-parsed with iterparse)"""
+        if isinstance(root, (str, os.PathLike)):
+            return self._xml_stream_to_dict(root)
+        
+        # Explicit post-order walk: entries are (element, children by tag, child iterator)
+        stack = [(root, defaultdict(list), iter(root))]
+        while True:
+            element, children, child_iter = stack[-1]
+            for child in child_iter:
+                if len(child):
+                    stack.append((child, defaultdict(list), iter(child)))
+                    break
+                # Leaf elements are converted inline
+                children[child.tag].append(self._xml_node_value(child, {}))
+            else:
+                stack.pop()
+                value = self._xml_node_value(element, children)
+                if not stack:
+                    return {element.tag: value}
+                stack[-1][1][element.tag].append(value)
+    
+    def _xml_node_value(self, element: ET.Element, children: Dict[str, List[Any]]) -> Any:
+        """Build the JSON value for a closed element from its converted children"""
+        text = element.text
+        has_text = bool(text and text.strip())
+        
+        # No children, just text
+        if has_text and not children:
+            return text
+        
+        result = {}
+        
+        # Add attributes
+        if element.attrib:
+            result['@attributes'] = dict(element.attrib)
+        
+        # Add text content
+        if has_text:
+            result['#text'] = text.strip()
+        
+        # Add children, collapsing single occurrences to scalars
+        for tag, values in children.items():
+            result[tag] = values[0] if len(values) == 1 else values
+        
+        return result
+    
+    def _xml_stream_to_dict(self, source: str) -> Dict[str, Any]:
+        """Stream-convert an XML file, freeing each element once it is closed"""
+        # Stack entries: (element, children by tag)
+        stack = []
+        document = {}
+        
+        for event, element in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                stack.append((element, defaultdict(list)))
+                continue
+            
+            _, children = stack.pop()
+            value = self._xml_node_value(element, children)
+            
+            if stack:
+                parent, siblings = stack[-1]
+                siblings[element.tag].append(value)
                 
-                if child.tag in result:
-                    # Multiple children with same tag - convert to list
-                    if not isinstance(result[child.tag], list):
-                        result[child.tag] = [result[child.tag]]
-                    result[child.tag].append(child_data)
-                else:
-                    result[child.tag] = child_data
-            
-            return result
+                # Release the converted subtree
+                element.clear()
+                parent.remove(element)
+            else:
+                document = {element.tag: value}
         
-        return {root.tag: xml_element_to_dict(root)}
+        return document
     
     def json_to_xml(self, data: Dict[str, Any], options: Dict[str, Any]) -> ET.Element:
         """Convert JSON to XML"""
-        def dict_to_xml_element(tag, value):
-            element = ET.Element(tag)
+        # Get root element
+        if len(data) == 1:
+            root_tag, root_value = next(iter(data.items()))
+            root = ET.Element(root_tag)
+            pending = deque([(root, root_value)])
+        else:
+            # Multiple root elements - wrap in container
+            root = ET.Element('root')
+            pending = deque((ET.SubElement(root, key), value) for key, value in data.items())
+        
+        # Fill elements breadth-first; SubElement creates and appends each
+        # child in one C call, keeping siblings in document order
+        sub_element = ET.SubElement
+        while pending:
+            element, value = pending.popleft()
             
             if isinstance(value, dict):
                 # Handle attributes
@@ -242,60 +427,38 @@ class ARCSECConverter:
                 
                 # Handle child elements
                 for key, val in value.items():
-                    if key not in ['@attributes', '#text']:
-                        if isinstance(val, list):
-                            for item in val:
-                                child = dict_to_xml_element(key, item)
-                                element.append(child)
-                        else:
-                            child = dict_to_xml_element(key, val)
-                            element.append(child)
+                    if key == '@attributes' or key == '#text':
+                        continue
+                    if isinstance(val, list):
+                        for item in val:
+                            pending.append((sub_element(element, key), item))
+                    else:
+                        pending.append((sub_element(element, key), val))
             
             elif isinstance(value, list):
                 # Multiple values for same tag
                 for item in value:
-                    child = dict_to_xml_element('item', item)
-                    element.append(child)
+                    pending.append((sub_element(element, 'item'), item))
             
             else:
                 # Simple value
                 element.text = str(value)
-            
-            return element
         
-        # Get root element
-        if len(data) == 1:
-            root_tag, root_value = next(iter(data.items()))
-            return dict_to_xml_element(root_tag, root_value)
-        else:
-            # Multiple root elements - wrap in container
-            root = ET.Element('root')
-            for key, value in data.items():
-                child = dict_to_xml_element(key, value)
-                root.append(child)
-            return root
+        return root
     
     def legacy_to_arcsec(self, data: Any, options: Dict[str, Any]) -> Dict[str, Any]:
         """Convert legacy format to ARCSEC-compliant format"""
         if isinstance(data, str):
             try:
-                data = json.loads(data)
+                data = json_loads(data)
             except json.JSONDecodeError:
                 # Treat as plain text
                 data = {"content": data}
         
         # Add ARCSEC metadata
-        arcsec_data = {
-            "_arcsec_metadata": {
-                "version": self.version,
-                "creator": self.creator,
-                "copyright": f"© 2025 {self.creator} - All Rights Reserved",
-                "digital_signature": self.digital_signature,
-                "converted": datetime.now(timezone.utc).isoformat(),
-                "protection_level": "ARCSEC_PROTECTED",
-                "conversion_source": "legacy_format"
-            }
-        }
+        metadata = self._arcsec_template.copy()
+        metadata["converted"] = self._timestamp()
+        arcsec_data = {"_arcsec_metadata": metadata}
         
         if isinstance(data, dict):
             arcsec_data.update(data)
@@ -305,18 +468,26 @@ class ARCSECConverter:
         return arcsec_data
     
     def arcsec_to_standard(self, data: Dict[str, Any], options: Dict[str, Any]) -> Any:
-        """Convert ARCSEC format to standard format"""
-        if isinstance(data, dict) and "_arcsec_metadata" in data:
-            # Remove ARCSEC metadata
+        """Convert ARCSEC format to standard format
+        
+        A stripped copy is returned unless options sets "in_place" to True,
+        in which case the metadata key is popped from data itself.
+        """
+        if not (isinstance(data, dict) and "_arcsec_metadata" in data):
+            return data
+        
+        # Remove ARCSEC metadata
+        if options.get("in_place", False):
+            data.pop("_arcsec_metadata")
+            standard_data = data
+        else:
             standard_data = {k: v for k, v in data.items() if k != "_arcsec_metadata"}
-            
-            # If only "data" key remains, return its value
-            if len(standard_data) == 1 and "data" in standard_data:
-                return standard_data["data"]
-            
-            return standard_data
         
-        return data
+        # If only "data" key remains, return its value
+        if len(standard_data) == 1 and "data" in standard_data:
+            return standard_data["data"]
+        
+        return standard_data
     
     def base64_encode(self, data: bytes, options: Dict[str, Any]) -> str:
         """Encode binary data to base64"""
@@ -334,6 +505,49 @@ class ARCSECConverter:
         """Convert hexadecimal to binary data"""
         return bytes.fromhex(data.strip())
     
+    # Streaming conversions
+    def _fused_convert(self, in_path: str, out_path: str, transform: Callable[[bytes], bytes],
+                       align: int = 1, strip_whitespace: bool = False):
+        """Read, transform and write a file chunk-by-chunk, bytes to bytes"""
+        output_dir = os.path.dirname(out_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        # Stream into a temporary file beside the output and move it into place
+        # only on success, so invalid input never leaves a truncated output behind.
+        # A symlinked output has its target replaced, as writing through it did
+        if os.path.islink(out_path):
+            out_path = os.path.realpath(out_path)
+        tmp_path = os.path.join(os.path.dirname(out_path),
+                                f".{os.path.basename(out_path)}.{os.urandom(6).hex()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with open(fd, 'wb', buffering=self.stream_buffer_size) as dst, \
+                    open(in_path, 'rb', buffering=self.stream_buffer_size) as src:
+                pending = b''
+                while chunk := src.read(self.stream_chunk_size):
+                    if strip_whitespace:
+                        chunk = chunk.translate(None, b' \t\r\n\v\f')
+                    if pending:
+                        chunk = pending + chunk
+                    
+                    # Carry any partial encoding group over to the next chunk
+                    usable = len(chunk) - len(chunk) % align
+                    dst.write(transform(chunk[:usable]))
+                    pending = chunk[usable:]
+                
+                if pending:
+                    dst.write(transform(pending))
+            
+            # An existing output keeps its permissions, as rewriting it in place did
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(out_path).st_mode))
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    
     def batch_convert(self, input_pattern: str, output_pattern: str, 
                      conversion_type: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Batch convert multiple files"""
@@ -354,30 +568,59 @@ class ARCSECConverter:
         print(f"📦 Batch converting {len(input_files)} files...")
         print(f"🔄 Conversion type: {conversion_type}")
         
-        for i, input_file in enumerate(input_files, 1):
-            print(f"\n📝 Processing [{i}/{len(input_files)}]: {input_file}")
-            
+        # Build conversion tasks up front; each file is independent work
+        tasks = []
+        for input_file in input_files:
             # Generate output filename
             input_path = Path(input_file)
             if '*' in output_pattern:
                 output_file = output_pattern.replace('*', input_path.stem)
             else:
                 output_file = f"{output_pattern}/{input_path.stem}_converted{self.get_output_extension(conversion_type)}"
-            
-            # Perform conversion
-            result = self.convert_file(input_file, output_file, conversion_type, options)
-            
-            if result["success"]:
-                results["successful"] += 1
-                results["conversions"].append(result)
-                print(f"   ✅ Success: {output_file}")
-            else:
-                results["failed"] += 1
-                results["errors"].append({
-                    "input_file": input_file,
-                    "error": result["error"]
-                })
-                print(f"   ❌ Failed: {result['error']}")
+            tasks.append((input_file, output_file, conversion_type, options))
+        
+        # Start kernel readahead for the first inputs in the batch
+        prefetch_window = self.prefetch_window if len(tasks) >= self.prefetch_min_files else 0
+        for task in tasks[:prefetch_window]:
+            self.prefetch_file(task[0])
+        
+        # Perform conversions across a process pool
+        max_workers = min(os.cpu_count() or 1, len(tasks))
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           initializer=_init_batch_worker,
+                                           initargs=(type(self), self._worker_options()))
+            batch_results = executor.map(_convert_one, tasks, chunksize=4)
+        else:
+            executor = None
+            batch_results = ((self.convert_file(*task), "") for task in tasks)
+        
+        try:
+            for i, (task, (result, output)) in enumerate(zip(tasks, batch_results), 1):
+                input_file, output_file = task[0], task[1]
+                # Worker progress output is relayed here in task order instead of interleaving
+                if output:
+                    print(output, end="")
+                print(f"\n📝 Processed [{i}/{len(tasks)}]: {input_file}")
+                
+                # Slide the readahead window forward
+                if prefetch_window and i - 1 + prefetch_window < len(tasks):
+                    self.prefetch_file(tasks[i - 1 + prefetch_window][0])
+                
+                if result["success"]:
+                    results["successful"] += 1
+                    results["conversions"].append(result)
+                    print(f"   ✅ Success: {output_file}")
+                else:
+                    results["failed"] += 1
+                    results["errors"].append({
+                        "input_file": input_file,
+                        "error": result["error"]
+                    })
+                    print(f"   ❌ Failed: {result['error']}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         print(f"\n📊 Batch conversion complete:")
         print(f"   ✅ Successful: {results['successful']}")
@@ -386,24 +629,17 @@ class ARCSECConverter:
         
         return results
     
+    def _worker_options(self) -> Dict[str, Any]:
+        """Settings batch workers copy onto their converters; subclasses add their own state"""
+        return {
+            "stream_chunk_size": self.stream_chunk_size,
+            "stream_buffer_size": self.stream_buffer_size,
+            "timestamp_ttl": self.timestamp_ttl
+        }
+    
     def get_output_extension(self, conversion_type: str) -> str:
         """Get appropriate file extension for conversion type"""
-        extension_map = {
-            'json_to_yaml': '.yml',
-            'yaml_to_json': '.json',
-            'csv_to_json': '.json',
-            'json_to_csv': '.csv',
-            'xml_to_json': '.json',
-            'json_to_xml': '.xml',
-            'legacy_to_arcsec': '.json',
-            'arcsec_to_standard': '.json',
-            'base64_encode': '.b64',
-            'base64_decode': '.bin',
-            'binary_to_hex': '.hex',
-            'hex_to_binary': '.bin'
-        }
-        
-        return extension_map.get(conversion_type, '.converted')
+        return self._EXT_MAP.get(conversion_type, '.converted')
     
     def validate_conversion(self, original_path: str, converted_path: str, 
                           conversion_type: str) -> Dict[str, Any]:
@@ -416,8 +652,10 @@ class ARCSECConverter:
         
         try:
             # Check file existence
+            original_stat = self._stat(original_path)
+            converted_stat = self._stat(converted_path)
             validation_result["checks"]["files_exist"] = (
-                os.path.exists(original_path) and os.path.exists(converted_path)
+                original_stat is not None and converted_stat is not None
             )
             
             if not validation_result["checks"]["files_exist"]:
@@ -425,8 +663,8 @@ class ARCSECConverter:
                 return validation_result
             
             # Check file sizes
-            original_size = os.path.getsize(original_path)
-            converted_size = os.path.getsize(converted_path)
+            original_size = original_stat.st_size
+            converted_size = converted_stat.st_size
             
             validation_result["checks"]["size_reasonable"] = (
                 converted_size > 0 and converted_size < original_size * 10
@@ -457,33 +695,26 @@ class ARCSECConverter:
     
     def validate_round_trip(self, original_path: str, converted_path: str, 
                            conversion_type: str) -> bool:
-        """Validate by performing round-trip conversion"""
+        """Validate that the converted file holds the same data as the original"""
+        if conversion_type not in ('json_to_yaml', 'yaml_to_json'):
+            return True  # Can't validate round-trip
+        
         try:
-            with tempfile.NamedTemporaryFile(suffix='.tmp', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            # Determine reverse conversion
-            reverse_conversions = {
-                'json_to_yaml': 'yaml_to_json',
-                'yaml_to_json': 'json_to_yaml'
-            }
-            
-            reverse_type = reverse_conversions.get(conversion_type)
-            if not reverse_type:
-                return True  # Can't validate round-trip
-            
-            # Perform reverse conversion
-            self.convert_file(converted_path, temp_path, reverse_type)
-            
-            # Compare original and round-trip result
-            with open(original_path, 'r') as f1, open(temp_path, 'r') as f2:
-                original_data = json.load(f1) if original_path.endswith('.json') else yaml.safe_load(f1)
-                roundtrip_data = json.load(f2) if temp_path.endswith('.json') else yaml.safe_load(f2)
+            # JSON and YAML share a data model, so comparing the loaded
+            # documents is equivalent to a full reverse conversion
+            with open(original_path, 'rb') as f:
+                if original_path.endswith('.json'):
+                    original_data = json_loads(f.read())
+                else:
+                    original_data = yaml.load(f, Loader=_YAMLLoader)
             
-            # Clean up
-            os.unlink(temp_path)
+            with open(converted_path, 'rb') as f:
+                if conversion_type == 'json_to_yaml':
+                    converted_data = yaml.load(f, Loader=_YAMLLoader)
+                else:
+                    converted_data = json_loads(f.read())
             
-            return original_data == roundtrip_data
+            return original_data == converted_data
             
         except Exception:
             return False
@@ -491,8 +722,8 @@ class ARCSECConverter:
     def validate_arcsec_metadata(self, filepath: str) -> bool:
         """Validate ARCSEC metadata in converted file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = json_loads(f.read())
             
             if not isinstance(data, dict) or "_arcsec_metadata" not in data:
                 return False
@@ -508,11 +739,39 @@ class ARCSECConverter:
     def calculate_file_checksum(self, filepath: str) -> str:
         """Calculate SHA256 checksum of file"""
         sha256_hash = hashlib.sha256()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
+        buffers = self._hash_buffers
+        try:
+            buffer, view = buffers.buffer, buffers.view
+        except AttributeError:
+            buffer = buffers.buffer = bytearray(1 << 20)
+            view = buffers.view = memoryview(buffer)
+        
+        # Unbuffered readinto fills this thread's buffer straight from the fd
+        with open(filepath, "rb", buffering=0) as f:
+            if hasattr(os, 'posix_fadvise'):
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while n := f.readinto(buffer):
+                sha256_hash.update(view[:n])
         return sha256_hash.hexdigest()
     
+    def prefetch_file(self, filepath: str):
+        """Ask the kernel to read a file into the page cache ahead of use"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            return
+        
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
     def format_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -523,22 +782,25 @@ class ARCSECConverter:
     
     def get_supported_conversions(self) -> Dict[str, str]:
         """Get list of supported conversions"""
-        descriptions = {
-            'json_to_yaml': 'Convert JSON to YAML format',
-            'yaml_to_json': 'Convert YAML to JSON format',
-            'csv_to_json': 'Convert CSV to JSON format',
-            'json_to_csv': 'Convert JSON to CSV format',
-            'xml_to_json': 'Convert XML to JSON format',
-            'json_to_xml': 'Convert JSON to XML format',
-            'legacy_to_arcsec': 'Convert legacy format to ARCSEC-compliant format',
-            'arcsec_to_standard': 'Convert ARCSEC format to standard format',
-            'base64_encode': 'Encode binary data to base64',
-            'base64_decode': 'Decode base64 to binary data',
-            'binary_to_hex': 'Convert binary data to hexadecimal',
-            'hex_to_binary': 'Convert hexadecimal to binary data'
-        }
-        
-        return descriptions
+        return dict(self._DESCRIPTIONS)
+
+# Batch worker state: one converter per worker process
+_batch_worker_converter = None
+
+def _init_batch_worker(converter_cls, options: Dict[str, Any]):
+    """Create the per-process converter used by batch workers, configured like the parent's"""
+    global _batch_worker_converter
+    with contextlib.redirect_stdout(None):
+        _batch_worker_converter = converter_cls()
+    for name, value in options.items():
+        setattr(_batch_worker_converter, name, value)
+
+def _convert_one(task):
+    """Convert a single (input, output, conversion_type, options) batch task, capturing its output"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = _batch_worker_converter.convert_file(*task)
+    return result, output.getvalue()
 
 def main():
     """Main execution function"""
@@ -7,6 +7,8 @@ Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
 """
 
 import os
+import sys
+import errno
 import json
 import hashlib
 import hmac
@@ -14,19 +16,109 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 import subprocess
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 import base64
 import zlib
+import mmap
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from arcsec_common import json_dumps, json_loads
+
+try:
+    import blake3
+except ImportError:  # blake3 is optional; BLAKE2b is always recorded
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; verify then goes straight to the cryptographic hashes
+    xxhash = None
+
+# File name prefixes that mark ARCSEC files
+ARCSEC_PREFIXES = frozenset({"arcsec", "ARCSEC"})
+
+# Manifest layout version, saved as manifest_metadata.format_version; 2.0
+# manifests are Merkle-sealed and may carry a blake3 digest per file
+MANIFEST_FORMAT_VERSION = "2.0"
+
+# Manifests saved at this version seal the full fingerprint JSON document
+LEGACY_MANIFEST_FORMAT_VERSION = "1.0"
+
+# Integrity seal input formats
+SEAL_FORMAT_FULL_JSON = "FULL_JSON_SHA256"
+SEAL_FORMAT_MERKLE = "MERKLE_SHA256"
 
 class ARCSECFingerprint:
-    def __init__(self):
+    # Settings pool workers copy from the parent so both pools fingerprint alike
+    _WORKER_SETTINGS = ("digital_signature", "key_cache_path", "chunk_size", "mmap_min_size",
+                        "direct_io_min_size", "exact_compression_ratio",
+                        "compression_sample_size", "small_file_max_size")
+    
+    def __init__(self, cache_path: Optional[str] = None, include_sha512: bool = False):
         self.digital_signature = "a6672edf248c5eeef3054ecca057075c938af653"
         self.creator = "Daniel Guzman"
         self.version = "3.0X"
         self.last_updated = "2025-07-30T20:00:00Z"
         self.protection_level = "WAR_MODE_MAXIMUM"
-        self.secret_key = self.derive_secret_key()
+        # The derived key is cached here (mode 0600) so later runs skip PBKDF2
+        self.key_cache_path = Path("~/.arcsec/key.bin")
+        self.chunk_size = 1 << 20
+        
+        # (time_ns, ISO string) of the last formatted wall-clock timestamp
+        self._now_cache = (0, "")
+        
+        # SHA-256 and BLAKE2b are independent families; SHA-512 is an extra opt-in pass
+        # BLAKE3 is added when installed; verify compares whichever digests both sides have
+        self.algorithms = ("sha256", "sha512", "blake2b") if include_sha512 else ("sha256", "blake2b")
+        if blake3 is not None:
+            self.algorithms += ("blake3",)
+        # A non-cryptographic XXH3 canary lets verify reject changed files cheaply
+        if xxhash is not None:
+            self.algorithms += ("xxh3_128",)
+        self._hash_factories = {
+            "sha256": self._sha256,
+            "sha512": hashlib.sha512,
+            "blake2b": self._blake2b,
+            "blake3": self._blake3,
+            "xxh3_128": self._xxh3_128
+        }
+        self.mmap_min_size = 1 << 20
+        # On Linux, files above direct_io_min_size are read with O_DIRECT so cold
+        # multi-GB files bypass the page cache; None disables it
+        self.direct_io_min_size = 64 << 20
         
+        # compression_ratio is estimated from the leading window of each chunk;
+        # set exact_compression_ratio to deflate the whole file instead
+        self.exact_compression_ratio = False
+        self.compression_sample_size = 64 << 10
+        
+        # Scans totalling less than this many bytes hash on threads (hashlib
+        # releases the GIL); larger scans use a process pool
+        self.process_pool_min_bytes = 64 << 20
+        
+        # Files up to small_file_max_size are hashed from a single read, and
+        # threaded scans hand workers up to small_file_batch_size files per task
+        self.small_file_max_size = 64 << 10
+        self.small_file_batch_size = 16
+        
+        # Opt-in fingerprint cache keyed by (st_dev, st_ino, st_mtime_ns, st_size);
+        # unchanged files reuse their last digests instead of being rehashed
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache: Dict[tuple, Dict[str, Any]] = self.load_cache() if self.cache_path else {}
+        
+    def _now_iso(self) -> str:
+        """Current UTC time in ISO format, reusing the last string within a 1 ms window"""
+        now_ns = time.time_ns()
+        cached_ns, cached_iso = self._now_cache
+        if 0 <= now_ns - cached_ns < 1_000_000:
+            return cached_iso
+        seconds, nanoseconds = divmod(now_ns, 1_000_000_000)
+        iso = datetime.fromtimestamp(seconds, timezone.utc).replace(
+            microsecond=nanoseconds // 1000).isoformat()
+        self._now_cache = (now_ns, iso)
+        return iso
+    
     def derive_secret_key(self) -> bytes:
         """Derive cryptographic key from digital signature"""
         return hashlib.pbkdf2_hmac(
@@ -36,71 +128,260 @@ class ARCSECFingerprint:
             100000
         )
     
-    def calculate_file_hash(self, filepath: str) -> Dict[str, Any]:
-        """Calculate comprehensive hash for a file"""
+    @cached_property
+    def secret_key(self) -> bytes:
+        """Secret key, derived on first use and shared across runs through key_cache_path"""
+        # Tag the cached key with its derivation inputs so a different signature re-derives
+        tag = hashlib.sha256(b"ARCSEC_WAR_MODE_SALT:100000:" +
+                             self.digital_signature.encode('utf-8')).digest()
+        try:
+            key_path = self.key_cache_path.expanduser()
+            with open(key_path, 'rb') as f:
+                file_stat = os.fstat(f.fileno())
+                cached = f.read()
+            # Only trust a private file owned by this user
+            if (file_stat.st_uid == os.getuid() and not file_stat.st_mode & 0o077
+                    and len(cached) == 64 and hmac.compare_digest(cached[:32], tag)):
+                return cached[32:]
+        except (OSError, RuntimeError, AttributeError):
+            pass
+        
+        secret_key = self.derive_secret_key()
+        try:
+            key_path = self.key_cache_path.expanduser()
+            key_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temp_path = key_path.with_name(f"{key_path.name}.{os.getpid()}.tmp")
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(tag + secret_key)
+            os.replace(temp_path, key_path)
+        except (OSError, RuntimeError):
+            pass
+        return secret_key
+    
+    @cached_property
+    def _hmac_template(self):
+        """HMAC keyed once; _hmac_sha256 clones it instead of re-running the key schedule"""
+        return hmac.new(self.secret_key, None, hashlib.sha256)
+    
+    def _sha256(self, data: bytes = b''):
+        """SHA-256 hasher through hashlib's OpenSSL backend (SHA-NI where supported)"""
+        return hashlib.sha256(data)
+    
+    def _blake2b(self, data: bytes = b''):
+        """BLAKE2b-512 hasher; the single point to swap in a faster backend"""
+        return hashlib.blake2b(data)
+    
+    def _blake3(self, data: bytes = b''):
+        """BLAKE3 hasher using its internal multithreading on large inputs"""
+        return blake3.blake3(data, max_threads=blake3.blake3.AUTO)
+    
+    def _xxh3_128(self, data: bytes = b''):
+        """XXH3-128 hasher; a fast canary only, never a substitute for the cryptographic digests"""
+        return xxhash.xxh3_128(data)
+    
+    def _hmac_sha256(self, data: Optional[bytes] = None):
+        """HMAC-SHA-256 hasher keyed with the ARCSEC secret key"""
+        hasher = self._hmac_template.copy()
+        if data is not None:
+            hasher.update(data)
+        return hasher
+    
+    def _read_chunks(self, f, consume: Callable[[Any], None]):
+        """Feed a file to consume() in chunk_size pieces; large files are memory-mapped"""
+        size = os.fstat(f.fileno()).st_size
+        if size > self.mmap_min_size:
+            # Hand page-cache memory straight to the hashers without copying
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mm) as view:
+                    for offset in range(0, len(mm), self.chunk_size):
+                        consume(view[offset:offset + self.chunk_size])
+        else:
+            while chunk := f.read(self.chunk_size):
+                consume(chunk)
+    
+    def _read_direct(self, filepath: str, consume: Callable[[Any], None]) -> bool:
+        """Feed a file to consume() through O_DIRECT reads; False if direct I/O is unsupported"""
+        if not sys.platform.startswith('linux') or not hasattr(os, 'O_DIRECT'):
+            return False
+        try:
+            fd = os.open(filepath, os.O_RDONLY | os.O_DIRECT)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return False
+            raise
+        
+        consumed = False
+        try:
+            # Anonymous mappings are page-aligned, as O_DIRECT requires
+            with mmap.mmap(-1, self.chunk_size) as buffer, memoryview(buffer) as view:
+                while True:
+                    try:
+                        read = os.readv(fd, [buffer])
+                    except OSError as e:
+                        # Some filesystems accept O_DIRECT at open but reject the read
+                        if e.errno == errno.EINVAL and not consumed:
+                            return False
+                        raise
+                    if not read:
+                        return True
+                    consume(view[:read])
+                    consumed = True
+        finally:
+            os.close(fd)
+    
+    def calculate_file_hash(self, filepath: str, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Calculate comprehensive hash for a file; stat may be passed in to skip a stat() call"""
         try:
             path = Path(filepath)
-            if not path.exists():
-                return {"error": f"File not found: {filepath}"}
-            
-            # Read file content
-            with open(filepath, 'rb') as f:
-                content = f.read()
+            if stat is None:
+                if not path.exists():
+                    return {"error": f"File not found: {filepath}"}
+                
+                # Get file metadata
+                stat = path.stat()
+            cache_key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            cached = self._cached_entry(path, stat)
+            if cached is not None:
+                return self._build_fingerprint(path, stat, dict(cached["hashes"]),
+                                               cached["hmac_signature"],
+                                               cached["compression_ratio"])
             
-            # Calculate multiple hashes for verification
-            sha256_hash = hashlib.sha256(content).hexdigest()
-            sha512_hash = hashlib.sha512(content).hexdigest()
-            blake2b_hash = hashlib.blake2b(content).hexdigest()
+            # Calculate multiple hashes for verification, plus the HMAC for
+            # authenticity and the compressed size, in one pass over the file
+            digests = {name: self._hash_factories[name]() for name in self.algorithms}
+            hmac_hash = self._hmac_sha256()
+            updaters = [digest.update for digest in digests.values()] + [hmac_hash.update]
+            compressor = zlib.compressobj()
+            exact_ratio = self.exact_compression_ratio
+            sample_size = self.compression_sample_size
+            compressed_size = 0
+            sampled_size = 0
             
-            # Calculate HMAC for authenticity
-            hmac_signature = hmac.new(
-                self.secret_key,
-                content,
-                hashlib.sha256
-            ).hexdigest()
+            def consume(chunk):
+                nonlocal compressed_size, sampled_size
+                for update in updaters:
+                    update(chunk)
+                if exact_ratio:
+                    compressed_size += len(compressor.compress(chunk))
+                    sampled_size += len(chunk)
+                else:
+                    sample = chunk[:sample_size]
+                    compressed_size += len(zlib.compress(sample))
+                    sampled_size += len(sample)
             
-            # Get file metadata
-            stat = path.stat()
+            direct_io = (self.direct_io_min_size is not None
+                         and stat.st_size > self.direct_io_min_size
+                         and self._read_direct(filepath, consume))
+            if not direct_io:
+                with open(filepath, 'rb') as f:
+                    if stat.st_size <= self.small_file_max_size:
+                        consume(f.read())
+                    else:
+                        self._read_chunks(f, consume)
+            if exact_ratio:
+                compressed_size += len(compressor.flush())
             
-            # Create fingerprint
-            fingerprint = {
-                "filename": path.name,
-                "filepath": str(path.absolute()),
-                "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime, timezone.utc).isoformat(),
-                "modified": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
-                "fingerprinted": datetime.now(timezone.utc).isoformat(),
-                "hashes": {
-                    "sha256": sha256_hash,
-                    "sha512": sha512_hash,
-                    "blake2b": blake2b_hash
-                },
-                "hmac_signature": hmac_signature,
-                "compression_ratio": len(zlib.compress(content)) / len(content) if content else 0,
-                "metadata": {
-                    "creator": self.creator,
-                    "digital_signature": self.digital_signature,
-                    "version": self.version,
-                    "protection_level": "WAR_MODE",
-                    "tamper_detection": "ENABLED"
+            fingerprint = self._build_fingerprint(
+                path, stat,
+                {name: digest.hexdigest() for name, digest in digests.items()},
+                hmac_hash.hexdigest(),
+                compressed_size / sampled_size if sampled_size else 0
+            )
+            if self.cache_path:
+                self._cache[cache_key] = {
+                    "filepath": fingerprint["filepath"],
+                    "hashes": dict(fingerprint["hashes"]),
+                    "hmac_signature": fingerprint["hmac_signature"],
+                    "compression_ratio": fingerprint["compression_ratio"]
                 }
-            }
             
             return fingerprint
             
         except Exception as e:
             return {"error": f"Failed to fingerprint {filepath}: {str(e)}"}
     
+    def _cached_entry(self, path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Cached digests for an unchanged file, or None when the cache is off or misses"""
+        if not self.cache_path:
+            return None
+        cached = self._cache.get((stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        if (cached is not None and cached["filepath"] == str(path.absolute())
+                and cached["hashes"].keys() == set(self.algorithms)):
+            return cached
+        return None
+    
+    def _quick_hash(self, filepath: str) -> str:
+        """XXH3-128 of a file, used as the verify canary"""
+        hasher = self._xxh3_128()
+        with open(filepath, 'rb') as f:
+            self._read_chunks(f, hasher.update)
+        return hasher.hexdigest()
+    
+    def _build_fingerprint(self, path: Path, stat: os.stat_result, hashes: Dict[str, str],
+                           hmac_signature: str, compression_ratio: float) -> Dict[str, Any]:
+        """Assemble a file fingerprint from its metadata and digests"""
+        return {
+            "filename": path.name,
+            "filepath": str(path.absolute()),
+            "size": stat.st_size,
+            "created": datetime.fromtimestamp(stat.st_ctime, timezone.utc).isoformat(),
+            "modified": datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat(),
+            "fingerprinted": self._now_iso(),
+            "hashes": hashes,
+            "hmac_signature": hmac_signature,
+            "compression_ratio": compression_ratio,
+            "metadata": {
+                "creator": self.creator,
+                "digital_signature": self.digital_signature,
+                "version": self.version,
+                "protection_level": "WAR_MODE",
+                "tamper_detection": "ENABLED"
+            }
+        }
+    
+    def _cache_signature(self, entries: List[List[Any]]) -> str:
+        """HMAC over the canonical cache entries, domain-separated from other seals"""
+        payload = json.dumps(entries, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return self._hmac_sha256(b"ARCSEC_CACHE:" + payload.encode('utf-8')).hexdigest()
+    
+    def load_cache(self) -> Dict[tuple, Dict[str, Any]]:
+        """Load the fingerprint cache, discarding it if missing or its HMAC does not match"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = json_loads(f.read())
+            entries = data["entries"]
+            if not hmac.compare_digest(self._cache_signature(entries), data["hmac"]):
+                print(f"⚠️  Ignoring tampered fingerprint cache: {self.cache_path}")
+                return {}
+            return {tuple(entry[:4]): entry[4] for entry in entries}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable fingerprint cache: {e}")
+            return {}
+    
+    def save_cache(self) -> bool:
+        """Persist the fingerprint cache under its own HMAC"""
+        if not self.cache_path:
+            return False
+        try:
+            entries = [[*key, value] for key, value in list(self._cache.items())]
+            data = {"entries": entries, "hmac": self._cache_signature(entries)}
+            with open(self.cache_path, 'wb') as f:
+                f.write(json_dumps(data))
+            return True
+        except Exception as e:
+            print(f"❌ Failed to save fingerprint cache: {e}")
+            return False
+    
     def scan_arcsec_files(self, root_directory: str = ".") -> Dict[str, Any]:
         """Scan and fingerprint all ARCSEC files"""
-        arcsec_files = []
-        
         # Scan for ARCSEC files
-        for root, dirs, files in os.walk(root_directory):
-            for file in files:
-                if file.startswith("arcsec") or file.startswith("ARCSEC"):
-                    filepath = os.path.join(root, file)
-                    arcsec_files.append(filepath)
+        arcsec_entries = list(self._iter_arcsec_files(root_directory))
+        arcsec_files = [filepath for filepath, _ in arcsec_entries]
         
         # Generate fingerprints
         fingerprints = {}
@@ -108,9 +389,9 @@ class ARCSECFingerprint:
         
         print(f"🔍 Scanning {total_files} ARCSEC files for fingerprinting...")
         
-        for i, filepath in enumerate(arcsec_files, 1):
+        for i, (filepath, fingerprint) in enumerate(
+                zip(arcsec_files, self._map_fingerprints(arcsec_entries)), 1):
             print(f"📋 Fingerprinting [{i}/{total_files}]: {filepath}")
-            fingerprint = self.calculate_file_hash(filepath)
             fingerprints[filepath] = fingerprint
         
         # Create master hash map
@@ -119,7 +400,7 @@ class ARCSECFingerprint:
                 "version": self.version,
                 "creator": self.creator,
                 "digital_signature": self.digital_signature,
-                "generated": datetime.now(timezone.utc).isoformat(),
+                "generated": self._now_iso(),
                 "total_files": total_files,
                 "scan_directory": os.path.abspath(root_directory),
                 "protection_mode": "WAR_MODE_ACTIVE",
@@ -129,30 +410,122 @@ class ARCSECFingerprint:
             "integrity_seal": self.generate_integrity_seal(fingerprints)
         }
         
+        if self.cache_path:
+            self.save_cache()
+        
         return hash_map
     
-    def generate_integrity_seal(self, fingerprints: Dict[str, Any]) -> Dict[str, str]:
+    def _iter_arcsec_files(self, root_directory: str):
+        """Yield (path, stat) for ARCSEC files in os.walk order using a single scandir per directory"""
+        pending = [root_directory]
+        while pending:
+            directory = pending.pop()
+            subdirectories = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if is_dir:
+                            # Like os.walk, list symlinked directories but don't descend
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                        elif entry.name[:6] in ARCSEC_PREFIXES:
+                            # Reuse the scandir entry's stat; None lets the hasher report the error
+                            try:
+                                yield entry.path, entry.stat()
+                            except OSError:
+                                yield entry.path, None
+            except OSError:
+                continue
+            
+            # Visit subdirectories depth-first in listing order
+            pending.extend(reversed(subdirectories))
+    
+    def _map_fingerprints(self, entries: List[tuple]):
+        """Fingerprint (path, stat) entries in parallel, yielding results in input order"""
+        max_workers = min(os.cpu_count() or 1, len(entries))
+        if max_workers <= 1:
+            yield from self._fingerprint_batch(entries)
+            return
+        
+        total_bytes = sum(stat.st_size for _, stat in entries if stat is not None)
+        
+        if total_bytes < self.process_pool_min_bytes or self.cache_path:
+            # Small, I/O-bound scans: threads avoid process start-up and key derivation,
+            # and keep the fingerprint cache in this process
+            # Batch files per task so many small files don't pay executor overhead each,
+            # while leaving enough tasks to keep every worker busy
+            batch_size = max(1, min(self.small_file_batch_size,
+                                    len(entries) // (max_workers * 4)))
+            batches = [entries[i:i + batch_size]
+                       for i in range(0, len(entries), batch_size)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for batch in executor.map(self._fingerprint_batch, batches):
+                    yield from batch
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_fingerprint_worker,
+                                     initargs=(type(self), self._worker_options())) as executor:
+                yield from executor.map(_fingerprint_one, entries, chunksize=4)
+    
+    def _map_verifications(self, items: List[tuple], fast: bool = False):
+        """Verify (filepath, expected_fingerprint) pairs in parallel, yielding results in input order"""
+        max_workers = min(os.cpu_count() or 1, len(items))
+        if max_workers <= 1:
+            for filepath, expected_fingerprint in items:
+                yield self.verify_file_integrity(filepath, expected_fingerprint, fast)
+            return
+        
+        total_bytes = sum(expected.get("size") or 0 for _, expected in items)
+        if total_bytes < self.process_pool_min_bytes or self.cache_path or fast:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(
+                    lambda item: self.verify_file_integrity(item[0], item[1], fast), items)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_fingerprint_worker,
+                                     initargs=(type(self), self._worker_options())) as executor:
+                yield from executor.map(_verify_one, items, chunksize=4)
+    
+    def _worker_options(self) -> Dict[str, Any]:
+        """Constructor arguments and settings that pool workers need to fingerprint like this instance"""
+        options = {name: getattr(self, name) for name in self._WORKER_SETTINGS}
+        options["include_sha512"] = "sha512" in self.algorithms
+        return options
+    
+    def _fingerprint_batch(self, entries: List[tuple]) -> List[Dict[str, Any]]:
+        """Fingerprint a batch of (path, stat) entries in one worker task"""
+        return [self.calculate_file_hash(filepath, stat) for filepath, stat in entries]
+    
+    def generate_integrity_seal(self, fingerprints: Dict[str, Any],
+                                seal_format: str = SEAL_FORMAT_MERKLE) -> Dict[str, str]:
         """Generate cryptographic seal for the entire manifest"""
-        # Serialize fingerprints for hashing
-        fingerprint_data = json.dumps(fingerprints, sort_keys=True).encode('utf-8')
+        if seal_format == SEAL_FORMAT_MERKLE:
+            # Hash each (path, fingerprint) entry on its own and seal the
+            # path-ordered leaf digests instead of one giant JSON document
+            fingerprint_data = b"".join(
+                self._sha256(json.dumps([filepath, fingerprint], sort_keys=True,
+                                        separators=(',', ':'), ensure_ascii=False)
+                             .encode('utf-8')).digest()
+                for filepath, fingerprint in sorted(fingerprints.items())
+            )
+        else:
+            # Serialize fingerprints for hashing
+            fingerprint_data = json.dumps(fingerprints, sort_keys=True).encode('utf-8')
         
         # Calculate manifest hash
-        manifest_hash = hashlib.sha256(fingerprint_data).hexdigest()
+        manifest_hash = self._sha256(fingerprint_data).hexdigest()
         
         # Generate HMAC seal
-        integrity_seal = hmac.new(
-            self.secret_key,
-            fingerprint_data,
-            hashlib.sha256
-        ).hexdigest()
+        integrity_seal = self._hmac_sha256(fingerprint_data).hexdigest()
         
         # Create timestamp proof
-        timestamp = datetime.now(timezone.utc).isoformat()
-        timestamp_proof = hmac.new(
-            self.secret_key,
-            f"{manifest_hash}:{timestamp}".encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        timestamp = self._now_iso()
+        timestamp_proof = self._hmac_sha256(f"{manifest_hash}:{timestamp}".encode('utf-8')).hexdigest()
         
         return {
             "manifest_hash": manifest_hash,
@@ -163,9 +536,69 @@ class ARCSECFingerprint:
             "verification_status": "CRYPTOGRAPHICALLY_SEALED"
         }
     
-    def verify_file_integrity(self, filepath: str, expected_fingerprint: Dict[str, Any]) -> Dict[str, Any]:
+    def verify_file_integrity(self, filepath: str, expected_fingerprint: Dict[str, Any],
+                              fast: bool = False) -> Dict[str, Any]:
         """Verify a file against its expected fingerprint"""
-        current_fingerprint = self.calculate_file_hash(filepath)
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return {
+                "verified": False,
+                "status": "FILE_NOT_FOUND",
+                "error": f"File not found: {filepath}"
+            }
+        except OSError:
+            stat = None
+        
+        if stat is not None:
+            # A size change is tampering whatever the hashes say; skip hashing
+            if stat.st_size != expected_fingerprint.get("size"):
+                return {
+                    "verified": False,
+                    "status": "TAMPERED",
+                    "checks": {
+                        "size_consistency": False
+                    },
+                    "current_size": stat.st_size,
+                    "expected_fingerprint": expected_fingerprint,
+                    "verification_time": self._now_iso()
+                }
+            
+            # Fast mode trusts an unchanged size and modification time
+            if fast and datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat() == expected_fingerprint.get("modified"):
+                return {
+                    "verified": True,
+                    "status": "VERIFIED",
+                    "checks": {
+                        "size_consistency": True,
+                        "mtime_consistency": True
+                    },
+                    "expected_fingerprint": expected_fingerprint,
+                    "verification_time": self._now_iso()
+                }
+        
+            # Different canary means different bytes; skip the cryptographic pass.
+            # A match still gets the full check, since XXH3 collisions can be forged
+            expected_canary = expected_fingerprint.get("hashes", {}).get("xxh3_128")
+            if (xxhash is not None and expected_canary is not None
+                    and self._cached_entry(Path(filepath), stat) is None):
+                try:
+                    canary_match = self._quick_hash(filepath) == expected_canary
+                except OSError:
+                    canary_match = True
+                if not canary_match:
+                    return {
+                        "verified": False,
+                        "status": "TAMPERED",
+                        "checks": {
+                            "size_consistency": True,
+                            "canary_integrity": False
+                        },
+                        "expected_fingerprint": expected_fingerprint,
+                        "verification_time": self._now_iso()
+                    }
+        
+        current_fingerprint = self.calculate_file_hash(filepath, stat)
         
         if "error" in current_fingerprint:
             return {
@@ -174,11 +607,12 @@ class ARCSECFingerprint:
                 "error": current_fingerprint["error"]
             }
         
-        # Compare hashes
-        hash_match = (
-            current_fingerprint["hashes"]["sha256"] == expected_fingerprint.get("hashes", {}).get("sha256") and
-            current_fingerprint["hashes"]["sha512"] == expected_fingerprint.get("hashes", {}).get("sha512") and
-            current_fingerprint["hashes"]["blake2b"] == expected_fingerprint.get("hashes", {}).get("blake2b")
+        # Compare every configured hash the manifest also recorded, so manifests
+        # written with or without SHA-512 verify either way
+        expected_hashes = expected_fingerprint.get("hashes", {})
+        compared = [name for name in self.algorithms if name in expected_hashes]
+        hash_match = bool(compared) and all(
+            current_fingerprint["hashes"][name] == expected_hashes[name] for name in compared
         )
         
         # Verify HMAC
@@ -197,7 +631,7 @@ class ARCSECFingerprint:
             },
             "current_fingerprint": current_fingerprint,
             "expected_fingerprint": expected_fingerprint,
-            "verification_time": datetime.now(timezone.utc).isoformat()
+            "verification_time": self._now_iso()
         }
         
         return verification_result
@@ -208,8 +642,13 @@ class ARCSECFingerprint:
             fingerprints = manifest.get("file_fingerprints", {})
             expected_seal = manifest.get("integrity_seal", {})
             
-            # Recalculate integrity seal
-            current_seal = self.generate_integrity_seal(fingerprints)
+            # Recalculate integrity seal; manifests saved as the legacy format
+            # predate Merkle sealing, and unsaved manifests are always current
+            format_version = manifest.get("manifest_metadata", {}).get("format_version",
+                                                                       MANIFEST_FORMAT_VERSION)
+            seal_format = (SEAL_FORMAT_FULL_JSON if format_version == LEGACY_MANIFEST_FORMAT_VERSION
+                           else SEAL_FORMAT_MERKLE)
+            current_seal = self.generate_integrity_seal(fingerprints, seal_format)
             
             # Verify seal components
             seal_match = (
@@ -221,7 +660,7 @@ class ARCSECFingerprint:
                 "verified": seal_match,
                 "status": "MANIFEST_VERIFIED" if seal_match else "MANIFEST_TAMPERED",
                 "seal_integrity": seal_match,
-                "verification_time": datetime.now(timezone.utc).isoformat(),
+                "verification_time": self._now_iso(),
                 "expected_seal": expected_seal,
                 "current_seal": current_seal
             }
@@ -238,17 +677,17 @@ class ARCSECFingerprint:
         try:
             # Add final metadata
             manifest["manifest_metadata"] = {
-                "saved": datetime.now(timezone.utc).isoformat(),
+                "saved": self._now_iso(),
                 "filename": output_file,
-                "format_version": "1.0",
+                "format_version": MANIFEST_FORMAT_VERSION,
                 "encoding": "UTF-8",
                 "compression": "none",
                 "digital_signature": self.digital_signature
             }
             
             # Save to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(json_dumps(manifest))
             
             print(f"✅ Manifest saved to: {output_file}")
             print(f"🛡️  Protected files: {manifest['arcsec_fingerprint_manifest']['total_files']}")
@@ -260,11 +699,12 @@ class ARCSECFingerprint:
             print(f"❌ Failed to save manifest: {str(e)}")
             return False
     
-    def load_and_verify_manifest(self, manifest_file: str = "ARCSEC_FINGERPRINT_MANIFEST.json") -> Dict[str, Any]:
-        """Load and verify a fingerprint manifest"""
+    def load_and_verify_manifest(self, manifest_file: str = "ARCSEC_FINGERPRINT_MANIFEST.json",
+                                 fast: bool = False) -> Dict[str, Any]:
+        """Load and verify a fingerprint manifest; fast skips hashing files whose size and mtime match"""
         try:
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
+            with open(manifest_file, 'rb') as f:
+                manifest = json_loads(f.read())
             
             # Verify manifest integrity first
             manifest_verification = self.verify_manifest_integrity(manifest)
@@ -279,16 +719,25 @@ class ARCSECFingerprint:
             # Verify individual files
             file_verifications = {}
             fingerprints = manifest.get("file_fingerprints", {})
+            verified_files = 0
+            tampered_files = 0
+            
+            items = [(filepath, expected_fingerprint)
+                     for filepath, expected_fingerprint in fingerprints.items()
+                     if "error" not in expected_fingerprint]
             
-            for filepath, expected_fingerprint in fingerprints.items():
-                if "error" not in expected_fingerprint:
-                    verification = self.verify_file_integrity(filepath, expected_fingerprint)
-                    file_verifications[filepath] = verification
+            for (filepath, _), verification in zip(items, self._map_verifications(items, fast)):
+                file_verifications[filepath] = verification
+                if verification.get("verified", False):
+                    verified_files += 1
+                else:
+                    tampered_files += 1
+            
+            if self.cache_path:
+                self.save_cache()
             
             # Summary statistics
-            total_files = len(file_verifications)
-            verified_files = sum(1 for v in file_verifications.values() if v.get("verified", False))
-            tampered_files = total_files - verified_files
+            total_files = verified_files + tampered_files
             
             return {
                 "status": "VERIFICATION_COMPLETE",
@@ -308,6 +757,27 @@ class ARCSECFingerprint:
                 "error": str(e)
             }
 
+# Worker state: one fingerprinter per worker process
+_worker_fingerprinter = None
+
+def _init_fingerprint_worker(fingerprinter_cls, options: Dict[str, Any]):
+    """Create the per-process fingerprinter used by pool workers, configured like the parent's"""
+    global _worker_fingerprinter
+    settings = dict(options)
+    _worker_fingerprinter = fingerprinter_cls(include_sha512=settings.pop("include_sha512"))
+    for name, value in settings.items():
+        setattr(_worker_fingerprinter, name, value)
+
+def _fingerprint_one(entry: tuple) -> Dict[str, Any]:
+    """Fingerprint a single (path, stat) entry in a pool worker"""
+    filepath, stat = entry
+    return _worker_fingerprinter.calculate_file_hash(filepath, stat)
+
+def _verify_one(item: tuple) -> Dict[str, Any]:
+    """Verify a single (filepath, expected_fingerprint) pair in a pool worker"""
+    filepath, expected_fingerprint = item
+    return _worker_fingerprinter.verify_file_integrity(filepath, expected_fingerprint)
+
 def main():
     """Main execution function"""
     print("🔒 ARCSEC Fingerprint v3.0X - Cryptographic File Verification")
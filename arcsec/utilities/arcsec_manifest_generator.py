@@ -7,25 +7,222 @@ Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
 """
 
 import os
+import re
 import json
 import hashlib
 import mimetypes
 import subprocess
 import time
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field
 import zlib
 import base64
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+from arcsec_common import file_extension, json_dumps, json_line, json_loads
+
+try:
+    import blake3
+except ImportError:  # blake3 is optional; the hashlib algorithms are always available
+    blake3 = None
+
+def _json_default(obj: Any) -> Any:
+    """Encode raw digest bytes as hex and registry entries as dicts when serializing"""
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    if isinstance(obj, RegistryEntry):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Build and tool directories left out of the structure and registry
+SKIP_DIRS = frozenset({'node_modules', 'dist', '__pycache__', '.git'})
+
+# Extensions of files that always require ARCSEC protection
+CODE_EXTS = frozenset({'.ts', '.js', '.py', '.json'})
+
+# Content type by lowercase extension
+TYPE_MAP = {
+    '.ts': 'typescript',
+    '.js': 'javascript',
+    '.py': 'python',
+    '.json': 'configuration',
+    '.md': 'documentation',
+    '.txt': 'text',
+    '.yml': 'configuration',
+    '.yaml': 'configuration'
+}
+
+# MIME type by lowercase extension for the file types this project is made of.
+# Fixed here so the manifest does not depend on the host's mime.types (which maps
+# .ts to Qt Linguist); other extensions fall back to mimetypes
+EXT_TO_MIME = {
+    '.ts': 'application/typescript',
+    '.tsx': 'application/typescript',
+    '.js': 'text/javascript',
+    '.jsx': 'text/javascript',
+    '.mjs': 'text/javascript',
+    '.py': 'text/x-python',
+    '.json': 'application/json',
+    '.jsonl': 'application/jsonl',
+    '.md': 'text/markdown',
+    '.txt': 'text/plain',
+    '.yml': 'application/yaml',
+    '.yaml': 'application/yaml',
+    '.toml': 'application/toml',
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.mp3': 'audio/mpeg',
+    '.zip': 'application/zip',
+    '.kmz': 'application/vnd.google-earth.kmz',
+    '.gltf': 'model/gltf+json'
+}
+
+# Already-compressed formats; deflating them again only burns CPU
+INCOMPRESSIBLE_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.mp3', '.mp4', '.zip', '.kmz',
+    '.gz', '.bz2', '.xz', '.br', '.woff', '.woff2', '.pdf'
+})
+
+# Checksum algorithms by name
+HASH_FACTORIES = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256
+}
+if blake3 is not None:
+    HASH_FACTORIES["blake3"] = lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+# Name fragments per security level, highest priority first
+SECURITY_PATTERNS = (
+    ("CRITICAL", ("master-controller", "security", "universal-handler")),
+    ("HIGH", ("safety", "audit", "health-monitor")),
+    ("MEDIUM", ("service", "processor", "engine"))
+)
+
+# One compiled matcher labelling a lowercase name with its highest-priority level.
+# Each level is a lookahead from the start of the name, so a later fragment of a
+# higher level still wins over an earlier fragment of a lower one
+SECURITY_CLASSIFIER = re.compile(
+    "|".join(f"(?=.*?(?P<{level}>{'|'.join(map(re.escape, patterns))}))"
+             for level, patterns in SECURITY_PATTERNS),
+    re.DOTALL
+)
+
+# A whitespace-stripped line starting with "import " or "from " that mentions arcsec
+_IMPORT_RE = re.compile(
+    r'(?m)^[ \t\x0b\x0c\x1c-\x1f]*((?:import|from) [^\n]*?arcsec[^\n]*?)[ \t\x0b\x0c\x1c-\x1f]*$'
+)
+
+# Scanning through a directory fd lets DirEntry.stat() use fstatat relative to
+# it instead of resolving the full path again for every file
+_SCANDIR_FD = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+@dataclass
+class DirectoryRecord:
+    rel_path: str
+    abs_path: str
+    depth: int
+    subdirectories: List[str]
+    file_count: int
+    pruned: bool
+
+@dataclass
+class FileRecord:
+    path: str
+    rel_path: str
+    name: str
+    lname: str
+    directory: str
+    pruned: bool
+    is_arcsec: bool
+    suffix: str
+    ext: str
+    size: Optional[int] = None
+    ctime: Optional[float] = None
+    mtime: Optional[float] = None
+    mode: Optional[int] = None
+    mime: Optional[str] = None
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class RegistryEntry:
+    size: int
+    ctime: float
+    mtime: float
+    mode: int
+    mime_type: Optional[str]
+    is_arcsec: bool
+    protection_required: bool
+    content_type: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "created": datetime.fromtimestamp(self.ctime).isoformat(),
+            "modified": datetime.fromtimestamp(self.mtime).isoformat(),
+            "permissions": oct(self.mode)[-3:],
+            "mime_type": self.mime_type,
+            "is_arcsec": self.is_arcsec,
+            "protection_required": self.protection_required,
+            "content_type": self.content_type
+        }
+
+def _has_checksum(file_info: Any) -> bool:
+    """Whether a registry entry gets checksummed: anything but an {"error": ...} dict"""
+    return not (isinstance(file_info, dict) and "error" in file_info)
+
+@dataclass
+class ProjectTree:
+    directories: List[DirectoryRecord] = field(default_factory=list)
+    files: List[FileRecord] = field(default_factory=list)
 
 class ARCSECManifestGenerator:
-    def __init__(self):
+    def __init__(self, hash_algorithms: Optional[Iterable[str]] = None,
+                 checksum_cache_path: Optional[str] = None):
         self.digital_signature = "a6672edf248c5eeef3054ecca057075c938af653"
         self.creator = "Daniel Guzman"
         self.version = "3.0X"
         self.last_updated = "2025-07-30T20:00:00Z"
         self.protection_level = "WAR_MODE_MAXIMUM"
         self.generation_time = datetime.now(timezone.utc)
+        self.chunk_size = 1 << 20
+        self.mmap_min_size = 1 << 20
+        # Read size when a large file cannot be memory-mapped
+        self.read_buffer_size = 10 << 20
+        
+        # compression_ratio is a fast level-1 deflate estimate; files above
+        # compress_max_size or with an INCOMPRESSIBLE_EXTS extension report 1.0
+        self.compression_level = 1
+        self.compress_max_size = 64 << 20
+        
+        # Checksum runs of at least prefetch_min_files keep this many files hinted
+        # to the kernel ahead of the workers, so cold-cache reads overlap
+        self.prefetch_window = 64
+        self.prefetch_min_files = 16
+        
+        # extract_imports reads only the first import_scan_lines lines of a file,
+        # each cut off at import_max_line characters
+        self.import_scan_lines = 50
+        self.import_max_line = 1 << 20
+        
+        # SHA-256 alone covers integrity; md5, sha1 and blake3 are opt-in
+        self.hash_algorithms = tuple(dict.fromkeys(hash_algorithms or ("sha256",)))
+        unknown = [name for name in self.hash_algorithms if name not in HASH_FACTORIES]
+        if unknown:
+            raise ValueError(f"Unsupported hash algorithms: {', '.join(unknown)} "
+                             f"(available: {', '.join(HASH_FACTORIES)})")
+        
+        # Opt-in checksum cache keyed by "st_ino:st_size:st_mtime_ns"; files whose
+        # key and path match an entry are not read again
+        self.checksum_cache_path = checksum_cache_path
         
     def generate_file_manifest(self, root_path: str = ".") -> Dict[str, Any]:
         """Generate comprehensive manifest of all ARCSEC files"""
@@ -34,6 +231,9 @@ class ARCSECManifestGenerator:
         print(f"👨‍💻 Creator: {self.creator}")
         print("📋 Scanning project structure...")
         
+        # Every section below is derived from this single walk
+        tree = self._walk_once(root_path)
+        
         manifest = {
             "arcsec_manifest_metadata": {
                 "version": self.version,
@@ -44,21 +244,146 @@ class ARCSECManifestGenerator:
                 "scan_root": os.path.abspath(root_path),
                 "protection_level": "WAR_MODE_MAXIMUM"
             },
-            "project_structure": self.scan_project_structure(root_path),
-            "arcsec_ecosystem": self.catalog_arcsec_files(root_path),
-            "file_registry": self.generate_file_registry(root_path),
-            "dependency_map": self.analyze_dependencies(root_path),
-            "security_classification": self.classify_security_levels(root_path),
+            "project_structure": self.scan_project_structure(root_path, tree),
+            "arcsec_ecosystem": self.catalog_arcsec_files(root_path, tree),
+            "file_registry": self.generate_file_registry(root_path, tree),
+            "dependency_map": self.analyze_dependencies(root_path, tree),
+            "security_classification": self.classify_security_levels(root_path, tree),
             "integrity_checksums": {}
         }
         
         # Generate checksums for all files
-        manifest["integrity_checksums"] = self.generate_checksums(manifest["file_registry"])
+        manifest["integrity_checksums"] = self.generate_checksums(manifest["file_registry"], root_path)
         
         return manifest
     
-    def scan_project_structure(self, root_path: str) -> Dict[str, Any]:
+    def _iter_tree(self, root_path: str):
+        """Yield (directory, pruned, kept subdirectory names, file entries) in os.walk order"""
+        # Explicit stack of (path, pruned): no recursion, and the pruned flag is
+        # inherited instead of looked up per directory
+        stack = [(root_path, False)]
+        while stack:
+            root, pruned = stack.pop()
+            subdirectories = []
+            children = []
+            files = []
+            fd = None
+            try:
+                if _SCANDIR_FD:
+                    fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+                # Entries from an fd scan carry only their name as path
+                with os.scandir(root if fd is None else fd) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if not is_dir:
+                            files.append(entry)
+                            continue
+                        
+                        # Hidden and build directories are still walked for ARCSEC files,
+                        # but are marked pruned for the structure and registry sections
+                        name = entry.name
+                        child_pruned = pruned or name[:1] == '.' or name in SKIP_DIRS
+                        if not child_pruned:
+                            subdirectories.append(name)
+                        # Like os.walk, list symlinked directories but don't descend into them
+                        if not entry.is_symlink():
+                            children.append((os.path.join(root, name), child_pruned))
+            except OSError:
+                if fd is not None:
+                    os.close(fd)
+                continue
+            
+            # Keep the fd open while the caller stats the file entries
+            try:
+                yield root, pruned, subdirectories, files
+            finally:
+                if fd is not None:
+                    os.close(fd)
+            
+            # Visit subdirectories depth-first in listing order
+            children.reverse()
+            stack += children
+    
+    def _walk_once(self, root_path: str) -> ProjectTree:
+        """Walk root_path once, recording directories and the file metadata every section needs"""
+        tree = ProjectTree()
+        
+        # The checksum cache may sit inside the scanned tree, but it is the
+        # generator's own state, not a project file
+        cache_path = cache_name = None
+        if self.checksum_cache_path:
+            cache_path = os.path.abspath(self.checksum_cache_path)
+            cache_name = os.path.basename(cache_path)
+        
+        for root, pruned, subdirectories, files in self._iter_tree(root_path):
+            if cache_name is not None:
+                files = [entry for entry in files
+                         if entry.name != cache_name
+                         or os.path.abspath(os.path.join(root, entry.name)) != cache_path]
+            
+            rel_path = os.path.relpath(root, root_path)
+            if rel_path == ".":
+                rel_path = "/"
+            
+            tree.directories.append(DirectoryRecord(
+                rel_path=rel_path,
+                abs_path=os.path.abspath(root),
+                depth=root.replace(root_path, '').count(os.sep),
+                subdirectories=subdirectories,
+                file_count=len(files),
+                pruned=pruned
+            ))
+            
+            for entry in files:
+                file = entry.name
+                lname = file.lower()
+                is_arcsec = "arcsec" in lname
+                listed = not (pruned or file.startswith('.'))
+                if not (is_arcsec or listed):
+                    continue
+                
+                filepath = os.path.join(root, file)
+                suffix = file_extension(file)
+                ext = suffix.lower()
+                mime = EXT_TO_MIME.get(ext)
+                if mime is None:
+                    mime = mimetypes.guess_type(filepath)[0]
+                record = FileRecord(
+                    path=filepath,
+                    rel_path=os.path.relpath(filepath, root_path),
+                    name=file,
+                    lname=lname,
+                    directory=rel_path,
+                    pruned=pruned,
+                    is_arcsec=is_arcsec,
+                    suffix=suffix,
+                    ext=ext,
+                    mime=mime
+                )
+                
+                # One stat per file serves every section; DirEntry caches it
+                try:
+                    stat = entry.stat()
+                    record.size = stat.st_size
+                    record.ctime = stat.st_ctime
+                    record.mtime = stat.st_mtime
+                    record.mode = stat.st_mode
+                except OSError as e:
+                    record.error = str(e)
+                
+                tree.files.append(record)
+        
+        return tree
+    
+    def scan_project_structure(self, root_path: str, tree: Optional[ProjectTree] = None) -> Dict[str, Any]:
         """Scan and map the complete project structure"""
+        if tree is None:
+            tree = self._walk_once(root_path)
+        
         structure = {
             "directories": {},
             "total_files": 0,
@@ -66,55 +391,52 @@ class ARCSECManifestGenerator:
             "file_types": {},
             "depth_analysis": {}
         }
+        depth_analysis = defaultdict(lambda: {"dirs": 0, "files": 0})
+        file_types = Counter()
         
-        for root, dirs, files in os.walk(root_path):
-            level = root.replace(root_path, '').count(os.sep)
-            
-            # Skip hidden and build directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'dist', '__pycache__']]
-            
-            rel_path = os.path.relpath(root, root_path)
-            if rel_path == ".":
-                rel_path = "/"
+        for directory in tree.directories:
+            if directory.pruned:
+                continue
             
-            structure["directories"][rel_path] = {
-                "absolute_path": os.path.abspath(root),
+            level = directory.depth
+            structure["directories"][directory.rel_path] = {
+                "absolute_path": directory.abs_path,
                 "depth": level,
-                "subdirectories": dirs.copy(),
+                "subdirectories": directory.subdirectories.copy(),
                 "files": [],
-                "file_count": len(files),
+                "file_count": directory.file_count,
                 "arcsec_files": 0
             }
             
             structure["total_directories"] += 1
+            depth_analysis[level]["dirs"] += 1
+        
+        for record in tree.files:
+            if record.pruned or record.name.startswith('.'):
+                continue
             
-            if level not in structure["depth_analysis"]:
-                structure["depth_analysis"][level] = {"dirs": 0, "files": 0}
-            structure["depth_analysis"][level]["dirs"] += 1
+            directory = structure["directories"][record.directory]
+            directory["files"].append(record.name)
+            structure["total_files"] += 1
+            depth_analysis[directory["depth"]]["files"] += 1
             
-            for file in files:
-                if file.startswith('.'):
-                    continue
-                    
-                filepath = os.path.join(root, file)
-                file_ext = Path(file).suffix.lower()
-                
-                structure["directories"][rel_path]["files"].append(file)
-                structure["total_files"] += 1
-                structure["depth_analysis"][level]["files"] += 1
-                
-                if file.startswith("arcsec") or "arcsec" in file.lower():
-                    structure["directories"][rel_path]["arcsec_files"] += 1
-                
-                # Track file types
-                if file_ext not in structure["file_types"]:
-                    structure["file_types"][file_ext] = 0
-                structure["file_types"][file_ext] += 1
+            if record.is_arcsec:
+                directory["arcsec_files"] += 1
+            
+            # Track file types
+            file_types[record.ext] += 1
+        
+        # Plain dicts for serialization
+        structure["file_types"] = dict(file_types)
+        structure["depth_analysis"] = dict(depth_analysis)
         
         return structure
     
-    def catalog_arcsec_files(self, root_path: str) -> Dict[str, Any]:
+    def catalog_arcsec_files(self, root_path: str, tree: Optional[ProjectTree] = None) -> Dict[str, Any]:
         """Catalog all ARCSEC files with detailed metadata"""
+        if tree is None:
+            tree = self._walk_once(root_path)
+        
         arcsec_files = {
             "core_services": [],
             "infrastructure": [],
@@ -131,31 +453,32 @@ class ARCSECManifestGenerator:
             ".md": "documentation"
         }
         
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                if "arcsec" in file.lower():
-                    filepath = os.path.join(root, file)
-                    rel_path = os.path.relpath(filepath, root_path)
-                    
-                    # Categorize file
-                    category = "infrastructure"
-                    for pattern, cat in categories.items():
-                        if pattern in file:
-                            category = cat
-                            break
-                    
-                    file_info = {
-                        "filename": file,
-                        "relative_path": rel_path,
-                        "absolute_path": os.path.abspath(filepath),
-                        "size": os.path.getsize(filepath),
-                        "modified": datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat(),
-                        "mime_type": mimetypes.guess_type(filepath)[0] or "application/octet-stream",
-                        "extension": Path(file).suffix,
-                        "protection_level": self.determine_protection_level(file)
-                    }
-                    
-                    arcsec_files[category].append(file_info)
+        for record in tree.files:
+            # Unreadable entries (e.g. dangling symlinks) have no metadata to catalog
+            if not record.is_arcsec or record.error is not None:
+                continue
+            
+            file = record.name
+            
+            # Categorize file
+            category = "infrastructure"
+            for pattern, cat in categories.items():
+                if pattern in file:
+                    category = cat
+                    break
+            
+            file_info = {
+                "filename": file,
+                "relative_path": record.rel_path,
+                "absolute_path": os.path.abspath(record.path),
+                "size": record.size,
+                "modified": datetime.fromtimestamp(record.mtime).isoformat(),
+                "mime_type": record.mime or "application/octet-stream",
+                "extension": record.suffix,
+                "protection_level": self.determine_protection_level(file, record.lname)
+            }
+            
+            arcsec_files[category].append(file_info)
         
         # Calculate totals
         arcsec_files["summary"] = {
@@ -167,42 +490,41 @@ class ARCSECManifestGenerator:
         
         return arcsec_files
     
-    def generate_file_registry(self, root_path: str) -> Dict[str, Any]:
+    def generate_file_registry(self, root_path: str, tree: Optional[ProjectTree] = None) -> Dict[str, Any]:
         """Generate comprehensive file registry"""
+        if tree is None:
+            tree = self._walk_once(root_path)
+        
         registry = {}
         
-        for root, dirs, files in os.walk(root_path):
-            # Skip hidden and build directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'dist', '__pycache__']]
+        for record in tree.files:
+            # Skip hidden files and anything under hidden or build directories
+            if record.pruned or record.name.startswith('.'):
+                continue
             
-            for file in files:
-                if file.startswith('.'):
-                    continue
-                    
-                filepath = os.path.join(root, file)
-                rel_path = os.path.relpath(filepath, root_path)
-                
-                try:
-                    stat = os.stat(filepath)
-                    
-                    registry[rel_path] = {
-                        "size": stat.st_size,
-                        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "permissions": oct(stat.st_mode)[-3:],
-                        "mime_type": mimetypes.guess_type(filepath)[0],
-                        "is_arcsec": "arcsec" in file.lower(),
-                        "protection_required": self.requires_protection(file),
-                        "content_type": self.analyze_content_type(filepath)
-                    }
-                    
-                except (OSError, IOError) as e:
-                    registry[rel_path] = {"error": str(e)}
+            if record.error is not None:
+                registry[record.rel_path] = {"error": record.error}
+                continue
+            
+            # Timestamps and permissions are only formatted when the manifest is serialized
+            registry[record.rel_path] = RegistryEntry(
+                size=record.size,
+                ctime=record.ctime,
+                mtime=record.mtime,
+                mode=record.mode,
+                mime_type=record.mime,
+                is_arcsec=record.is_arcsec,
+                protection_required=self.requires_protection(record.name, record.lname),
+                content_type=TYPE_MAP.get(record.ext, 'unknown')
+            )
         
         return registry
     
-    def analyze_dependencies(self, root_path: str) -> Dict[str, Any]:
+    def analyze_dependencies(self, root_path: str, tree: Optional[ProjectTree] = None) -> Dict[str, Any]:
         """Analyze project dependencies and interconnections"""
+        if tree is None:
+            tree = self._walk_once(root_path)
+        
         dependencies = {
             "npm_dependencies": {},
             "python_dependencies": {},
@@ -232,22 +554,21 @@ class ARCSECManifestGenerator:
         
         # Analyze ARCSEC file imports
         arcsec_imports = {}
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                if "arcsec" in file.lower() and file.endswith(('.ts', '.js', '.py')):
-                    filepath = os.path.join(root, file)
-                    rel_path = os.path.relpath(filepath, root_path)
-                    
-                    imports = self.extract_imports(filepath)
-                    if imports:
-                        arcsec_imports[rel_path] = imports
+        for record in tree.files:
+            if record.is_arcsec and record.name.endswith(('.ts', '.js', '.py')):
+                imports = self.extract_imports(record.path)
+                if imports:
+                    arcsec_imports[record.rel_path] = imports
         
         dependencies["arcsec_dependencies"] = arcsec_imports
         
         return dependencies
     
-    def classify_security_levels(self, root_path: str) -> Dict[str, Any]:
+    def classify_security_levels(self, root_path: str, tree: Optional[ProjectTree] = None) -> Dict[str, Any]:
         """Classify files by security requirements"""
+        if tree is None:
+            tree = self._walk_once(root_path)
+        
         classification = {
             "CRITICAL": [],
             "HIGH": [],
@@ -256,107 +577,236 @@ class ARCSECManifestGenerator:
             "PUBLIC": []
         }
         
-        critical_patterns = ["master-controller", "security", "universal-handler"]
-        high_patterns = ["safety", "audit", "health-monitor"]
-        medium_patterns = ["service", "processor", "engine"]
+        for record in tree.files:
+            if not record.is_arcsec:
+                continue
+            
+            match = SECURITY_CLASSIFIER.match(record.lname)
+            if match:
+                level = match.lastgroup
+            elif record.name.endswith('.md'):
+                level = "PUBLIC"
+            else:
+                level = "LOW"
+            
+            classification[level].append({
+                "file": record.rel_path,
+                "reason": f"Contains {level.lower()} security components"
+            })
+        
+        return classification
+    
+    def generate_checksums(self, file_registry: Dict[str, Any], root_path: str = ".") -> Dict[str, Any]:
+        """Generate checksums for all registered files"""
+        return dict(self.iter_checksums(file_registry, root_path))
+    
+    def iter_checksums(self, file_registry: Dict[str, Any],
+                       root_path: str = ".") -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (relative path, checksum) for the registered files in registry order"""
+        rel_paths = [filepath for filepath, file_info in file_registry.items() if _has_checksum(file_info)]
+        
+        # hashlib and zlib release the GIL on large buffers, so threads overlap
+        # disk reads with hashing of other files
+        max_workers = min(32, (os.cpu_count() or 1) * 2)
         
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                if "arcsec" in file.lower():
-                    filepath = os.path.relpath(os.path.join(root, file), root_path)
+        hits = {}
+        cache_keys = {}
+        fresh_cache = {}
+        if self.checksum_cache_path:
+            cache = self.load_checksum_cache()
+            for rel_path in rel_paths:
+                filepath = os.path.join(root_path, rel_path)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                key = f"{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}"
+                cached = self._cached_checksum(cache.get(key), filepath)
+                if cached is None:
+                    cache_keys[rel_path] = key
+                else:
+                    hits[rel_path] = cached
+                    fresh_cache[key] = cache[key]
+        
+        # Only cache misses are read
+        abs_paths = [os.path.join(root_path, filepath) for filepath in rel_paths if filepath not in hits]
+        
+        # Start kernel readahead for the first files
+        prefetch_window = self.prefetch_window if len(abs_paths) >= self.prefetch_min_files else 0
+        for filepath in abs_paths[:prefetch_window]:
+            self.prefetch_file(filepath)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._checksum_entry, abs_paths)
+            i = 0
+            for rel_path in rel_paths:
+                checksum = hits.pop(rel_path, None)
+                if checksum is None:
+                    checksum = next(results)
                     
-                    level = "LOW"
-                    if any(pattern in file.lower() for pattern in critical_patterns):
-                        level = "CRITICAL"
-                    elif any(pattern in file.lower() for pattern in high_patterns):
-                        level = "HIGH"
-                    elif any(pattern in file.lower() for pattern in medium_patterns):
-                        level = "MEDIUM"
-                    elif file.endswith('.md'):
-                        level = "PUBLIC"
+                    # Slide the readahead window forward
+                    if prefetch_window and i + prefetch_window < len(abs_paths):
+                        self.prefetch_file(abs_paths[i + prefetch_window])
+                    i += 1
                     
-                    classification[level].append({
-                        "file": filepath,
-                        "reason": f"Contains {level.lower()} security components"
-                    })
+                    if rel_path in cache_keys and "error" not in checksum:
+                        fresh_cache[cache_keys[rel_path]] = {
+                            "path": os.path.abspath(os.path.join(root_path, rel_path)), **checksum
+                        }
+                yield rel_path, checksum
         
-        return classification
+        if self.checksum_cache_path:
+            # Entries for files that are gone or changed are dropped
+            self.save_checksum_cache(fresh_cache)
     
-    def generate_checksums(self, file_registry: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate checksums for all registered files"""
-        checksums = {}
+    def _cached_checksum(self, entry: Optional[Dict[str, Any]], filepath: str) -> Optional[Dict[str, Any]]:
+        """Checksum from a cache entry, or None when it is for another file or lacks an algorithm"""
+        if (entry is None or entry.get("path") != os.path.abspath(filepath)
+                or not all(name in entry for name in self.hash_algorithms)):
+            return None
+        checksum = {name: bytes.fromhex(entry[name]) for name in self.hash_algorithms}
+        checksum.update({
+            "size": entry["size"],
+            "compressed_size": entry["compressed_size"],
+            "compression_ratio": entry["compression_ratio"]
+        })
+        return checksum
+    
+    def load_checksum_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the checksum cache, starting empty if it is missing or unreadable"""
+        try:
+            with open(self.checksum_cache_path, 'rb') as f:
+                return json_loads(f.read())["entries"]
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable checksum cache: {e}")
+            return {}
+    
+    def save_checksum_cache(self, entries: Dict[str, Dict[str, Any]]) -> bool:
+        """Persist the checksum cache"""
+        try:
+            with open(self.checksum_cache_path, 'wb') as f:
+                f.write(json_dumps({"entries": entries}, default=_json_default))
+            return True
+        except Exception as e:
+            print(f"❌ Failed to save checksum cache: {e}")
+            return False
+    
+    def prefetch_file(self, filepath: str):
+        """Ask the kernel to read a file into the page cache ahead of use"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
         
-        for filepath, file_info in file_registry.items():
-            if "error" in file_info:
-                continue
-                
-            try:
-                with open(filepath, 'rb') as f:
-                    content = f.read()
-                
-                checksums[filepath] = {
-                    "md5": hashlib.md5(content).hexdigest(),
-                    "sha1": hashlib.sha1(content).hexdigest(),
-                    "sha256": hashlib.sha256(content).hexdigest(),
-                    "size": len(content),
-                    "compressed_size": len(zlib.compress(content)),
-                    "compression_ratio": len(zlib.compress(content)) / len(content) if content else 0
-                }
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+        except OSError:
+            return
+        
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def _checksum_entry(self, filepath: str) -> Dict[str, Any]:
+        """Checksum one file, recording failures in the entry instead of raising"""
+        try:
+            return self.checksum_file(filepath)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def checksum_file(self, filepath: str) -> Dict[str, Any]:
+        """Hash and deflate a file in one streaming pass; digests are raw bytes, hex-encoded on save"""
+        digests = [HASH_FACTORIES[name]() for name in self.hash_algorithms]
+        compressor = None
+        size = 0
+        compressed_size = 0
+        
+        def consume(chunk):
+            nonlocal size, compressed_size
+            for digest in digests:
+                digest.update(chunk)
+            if compressor is not None:
+                compressed_size += len(compressor.compress(chunk))
+            size += len(chunk)
+        
+        with open(filepath, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if (file_size <= self.compress_max_size
+                    and file_extension(os.path.basename(filepath)).lower() not in INCOMPRESSIBLE_EXTS):
+                compressor = zlib.compressobj(self.compression_level)
+            
+            if file_size <= self.mmap_min_size:
+                # Small files: a single read
+                consume(f.read())
+            else:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    mm = None
                 
-            except Exception as e:
-                checksums[filepath] = {"error": str(e)}
+                if mm is None:
+                    while chunk := f.read(self.read_buffer_size):
+                        consume(chunk)
+                else:
+                    # Hash straight from the page cache instead of copying into bytes
+                    with mm, memoryview(mm) as view:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        for offset in range(0, len(mm), self.chunk_size):
+                            consume(view[offset:offset + self.chunk_size])
+        if compressor is not None:
+            compressed_size += len(compressor.flush())
+        else:
+            compressed_size = size
         
-        return checksums
+        checksum = {name: digest.digest() for name, digest in zip(self.hash_algorithms, digests)}
+        checksum.update({
+            "size": size,
+            "compressed_size": compressed_size,
+            "compression_ratio": compressed_size / size if size else 0
+        })
+        return checksum
     
-    def determine_protection_level(self, filename: str) -> str:
-        """Determine the protection level needed for a file"""
-        if "master-controller" in filename.lower():
+    def determine_protection_level(self, filename: str, lname: Optional[str] = None) -> str:
+        """Determine the protection level needed for a file; lname is the precomputed lowercase name"""
+        if lname is None:
+            lname = filename.lower()
+        if "master-controller" in lname:
             return "MAXIMUM"
-        elif "security" in filename.lower() or "safety" in filename.lower():
+        elif "security" in lname or "safety" in lname:
             return "HIGH"
-        elif "arcsec" in filename.lower():
+        elif "arcsec" in lname:
             return "PROTECTED"
         else:
             return "STANDARD"
     
-    def requires_protection(self, filename: str) -> bool:
-        """Check if file requires ARCSEC protection"""
-        return "arcsec" in filename.lower() or filename.endswith(('.ts', '.js', '.py', '.json'))
+    def requires_protection(self, filename: str, lname: Optional[str] = None) -> bool:
+        """Check if file requires ARCSEC protection; lname is the precomputed lowercase name"""
+        if lname is None:
+            lname = filename.lower()
+        return "arcsec" in lname or file_extension(filename) in CODE_EXTS
     
     def analyze_content_type(self, filepath: str) -> str:
         """Analyze and categorize file content"""
-        ext = Path(filepath).suffix.lower()
-        
-        type_map = {
-            '.ts': 'typescript',
-            '.js': 'javascript', 
-            '.py': 'python',
-            '.json': 'configuration',
-            '.md': 'documentation',
-            '.txt': 'text',
-            '.yml': 'configuration',
-            '.yaml': 'configuration'
-        }
-        
-        return type_map.get(ext, 'unknown')
+        return TYPE_MAP.get(file_extension(os.path.basename(filepath)).lower(), 'unknown')
     
     def extract_imports(self, filepath: str) -> List[str]:
         """Extract import statements from code files"""
         imports = []
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read only the scanned lines. Latin-1 maps bytes 1:1, so nothing is
+            # decoded up front, while text mode still translates \r and \r\n line ends
+            with open(filepath, 'r', encoding='latin-1') as f:
+                head = ''.join(f.readline(self.import_max_line) for _ in range(self.import_scan_lines))
             
             # Simple import extraction (would be more sophisticated in production)
-            lines = content.split('\n')
-            for line in lines[:50]:  # Check first 50 lines
-                line = line.strip()
-                if line.startswith('import ') and 'arcsec' in line:
-                    imports.append(line)
-                elif line.startswith('from ') and 'arcsec' in line:
-                    imports.append(line)
-                    
+            imports = [line.encode('latin-1').decode('utf-8', 'replace')
+                       for line in _IMPORT_RE.findall(head)]
+            
         except Exception:
             pass
         
@@ -375,8 +825,8 @@ class ARCSECManifestGenerator:
                 "version": self.version
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb') as f:
+                f.write(json_dumps(manifest, default=_json_default))
             
             print(f"📋 Manifest saved: {output_file}")
             print(f"🗂️  Total files: {manifest['project_structure']['total_files']}")
@@ -389,50 +839,126 @@ class ARCSECManifestGenerator:
             print(f"❌ Failed to save manifest: {str(e)}")
             return False
     
+    def save_manifest_ndjson(self, root_path: str = ".",
+                             output_file: str = "ARCSEC_PROJECT_MANIFEST.ndjson") -> bool:
+        """Generate the manifest and stream it to an NDJSON file, one record per line"""
+        # Lines: a "header" record with every section except the registry and
+        # checksums, one "file" record {path, registry, checksum} per registered
+        # file, then a closing "generation_metadata" record
+        print("🗺️  ARCSEC Manifest Generator v3.0X - ACTIVE (NDJSON stream)")
+        print("📋 Scanning project structure...")
+        
+        try:
+            tree = self._walk_once(root_path)
+            header = {
+                "record": "header",
+                "arcsec_manifest_metadata": {
+                    "version": self.version,
+                    "creator": self.creator,
+                    "digital_signature": self.digital_signature,
+                    "generated": self.generation_time.isoformat(),
+                    "generator": "ARCSEC Manifest Generator v3.0X",
+                    "scan_root": os.path.abspath(root_path),
+                    "protection_level": "WAR_MODE_MAXIMUM"
+                },
+                "project_structure": self.scan_project_structure(root_path, tree),
+                "arcsec_ecosystem": self.catalog_arcsec_files(root_path, tree),
+                "dependency_map": self.analyze_dependencies(root_path, tree),
+                "security_classification": self.classify_security_levels(root_path, tree)
+            }
+            registry = self.generate_file_registry(root_path, tree)
+            
+            # Checksums are written as they complete and never collected
+            checksums = self.iter_checksums(registry, root_path)
+            with open(output_file, 'wb') as f:
+                f.write(json_line(header, default=_json_default))
+                for rel_path, file_info in registry.items():
+                    record = {"record": "file", "path": rel_path, "registry": file_info}
+                    if _has_checksum(file_info):
+                        record["checksum"] = next(checksums)[1]
+                    f.write(json_line(record, default=_json_default))
+                
+                # Resume the generator past its last checksum so it saves the checksum cache
+                next(checksums, None)
+                
+                f.write(json_line({
+                    "record": "generation_metadata",
+                    "completed": datetime.now(timezone.utc).isoformat(),
+                    "output_file": output_file,
+                    "total_processing_time": (datetime.now(timezone.utc) - self.generation_time).total_seconds(),
+                    "digital_signature": self.digital_signature,
+                    "creator": self.creator,
+                    "version": self.version
+                }))
+            
+            print(f"📋 Manifest streamed: {output_file}")
+            print(f"🗂️  Total files: {header['project_structure']['total_files']}")
+            print(f"🛡️  ARCSEC files: {header['arcsec_ecosystem']['summary']['total_arcsec_files']}")
+            
+            return True
+            
+        except Exception as e:
+            print(f"❌ Failed to stream manifest: {str(e)}")
+            return False
+    
+    def read_manifest_records(self, input_file: str = "ARCSEC_PROJECT_MANIFEST.ndjson") -> Iterator[Dict[str, Any]]:
+        """Yield the records of an NDJSON manifest one at a time"""
+        with open(input_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json_loads(line)
+    
     def generate_summary_report(self, manifest: Dict[str, Any]) -> str:
         """Generate a human-readable summary report"""
-        report = []
-        report.append("🗺️  ARCSEC PROJECT MANIFEST SUMMARY")
-        report.append("=" * 50)
-        report.append(f"Generated: {manifest['arcsec_manifest_metadata']['generated']}")
-        report.append(f"Creator: {manifest['arcsec_manifest_metadata']['creator']}")
-        report.append(f"Digital Signature: {manifest['arcsec_manifest_metadata']['digital_signature']}")
-        report.append("")
-        
-        # Project structure summary
+        meta = manifest['arcsec_manifest_metadata']
         structure = manifest['project_structure']
-        report.append("📁 PROJECT STRUCTURE")
-        report.append(f"   Total Files: {structure['total_files']}")
-        report.append(f"   Total Directories: {structure['total_directories']}")
-        report.append(f"   Maximum Depth: {max(structure['depth_analysis'].keys()) if structure['depth_analysis'] else 0}")
-        report.append("")
-        
-        # ARCSEC ecosystem summary
-        ecosystem = manifest['arcsec_ecosystem']
-        report.append("🛡️  ARCSEC ECOSYSTEM")
-        report.append(f"   Total ARCSEC Files: {ecosystem['summary']['total_arcsec_files']}")
-        for category, count in ecosystem['summary']['by_category'].items():
-            report.append(f"   {category.replace('_', ' ').title()}: {count}")
-        report.append("")
-        
-        # Security classification
+        summary = manifest['arcsec_ecosystem']['summary']
         security = manifest['security_classification']
-        report.append("🔐 SECURITY CLASSIFICATION")
-        for level, files in security.items():
-            report.append(f"   {level}: {len(files)} files")
-        report.append("")
         
-        return "\n".join(report)
+        categories = "".join(f"   {category.replace('_', ' ').title()}: {count}\n"
+                             for category, count in summary['by_category'].items())
+        levels = "".join(f"   {level}: {len(files)} files\n" for level, files in security.items())
+        
+        return f"""🗺️  ARCSEC PROJECT MANIFEST SUMMARY
+{'=' * 50}
+Generated: {meta['generated']}
+Creator: {meta['creator']}
+Digital Signature: {meta['digital_signature']}
+
+📁 PROJECT STRUCTURE
+   Total Files: {structure['total_files']}
+   Total Directories: {structure['total_directories']}
+   Maximum Depth: {max(structure['depth_analysis'], default=0)}
+
+🛡️  ARCSEC ECOSYSTEM
+   Total ARCSEC Files: {summary['total_arcsec_files']}
+{categories}
+🔐 SECURITY CLASSIFICATION
+{levels}"""
 
 def main():
     """Main execution function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="ARCSEC Manifest Generator")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Stream the manifest to ARCSEC_PROJECT_MANIFEST.ndjson, one record per line")
+    args = parser.parse_args()
+    
     print("🗺️  ARCSEC Manifest Generator v3.0X")
     print("🛡️  Digital Signature: a6672edf248c5eeef3054ecca057075c938af653")
     print("👨‍💻 Creator: Daniel Guzman")
     print("⚡ Project Mapping & Documentation: ACTIVE")
     print()
     
-    generator = ARCSECManifestGenerator()
+    generator = ARCSECManifestGenerator(checksum_cache_path="ARCSEC_CHECKSUM_CACHE.json")
+    
+    if args.ndjson:
+        # Records are written as they are produced; no summary needs the whole manifest
+        if generator.save_manifest_ndjson():
+            print(f"\n✅ ARCSEC Manifest generation complete!")
+            print(f"📋 Manifest: ARCSEC_PROJECT_MANIFEST.ndjson")
+        return
     
     # Generate manifest
     print("🔍 Scanning project structure...")
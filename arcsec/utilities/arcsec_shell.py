@@ -7,17 +7,159 @@ Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
 """
 
 import os
+import io
+import re
 import sys
 import cmd
 import json
+import time
+import errno
+import ctypes
+import signal
+import importlib
+import traceback
+import contextlib
 import subprocess
 import shlex
+import tempfile
+import itertools
+from collections import deque, namedtuple
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import readline
 import atexit
 
+try:
+    import ijson
+except ImportError:  # ijson is optional; manifest view then loads the whole file
+    ijson = None
+
+# ARCSEC tool scripts the shell dispatches to, by module name
+TOOLS = (
+    "arcsec_fingerprint",
+    "arcsec_injector",
+    "arcsec_manifest_generator",
+    "arcsec_auto_injection_hook",
+    "arcsec_signature_imprinter",
+    "arcsec_token_creator",
+    "arcsec_packager",
+    "arcsec_converter"
+)
+
+# Tools that keep running in a child process: the injector installs signal handlers
+# and atexit hooks when constructed, and the hook runs a long-lived file watcher
+ISOLATED_TOOLS = frozenset({"arcsec_injector", "arcsec_auto_injection_hook"})
+
+# Listing icon by (case-sensitive) file extension; anything else gets 📄
+_EXT_ICON = {
+    ".json": "📄",
+    ".yml": "📄",
+    ".yaml": "📄",
+    ".py": "📝",
+    ".ts": "📝",
+    ".js": "📝"
+}
+
+# Dotted paths of the scalars "manifest view" shows
+MANIFEST_SUMMARY_FIELDS = (
+    "arcsec_manifest_metadata.generated",
+    "arcsec_manifest_metadata.creator",
+    "project_structure.total_files",
+    "project_structure.total_directories",
+    "arcsec_ecosystem.summary.total_arcsec_files"
+)
+
+# A run of characters that shlex (POSIX mode) does not treat as whitespace
+_WORD_RE = re.compile(r'[^ \t\r\n]+')
+
+def _split_args(arg: str) -> List[str]:
+    """shlex.split, skipping the lexer when there is no quoting or escaping to handle"""
+    if not arg:
+        return []
+    if '"' in arg or "'" in arg or '\\' in arg:
+        return shlex.split(arg)
+    return _WORD_RE.findall(arg)
+
+# Size and modification time, the only metadata the long listing shows
+_FastStat = namedtuple("_FastStat", ["st_size", "st_mtime"])
+
+# statx(2) flags: don't force a sync with remote filesystems, fetch only size and mtime
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_SIZE = 0x200
+_STATX_MTIME = 0x40
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("reserved", ctypes.c_int32)
+    ]
+
+class _Statx(ctypes.Structure):
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("spare", ctypes.c_uint64 * 16)
+    ]
+
+# Resolved on first use: whether libc statx can be called, and the function itself
+_STATX_AVAILABLE = None
+_statx = None
+
+def _load_statx():
+    """Look up statx in libc once; leaves _STATX_AVAILABLE False off Linux or on old libcs"""
+    global _STATX_AVAILABLE, _statx
+    _STATX_AVAILABLE = False
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        func = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    func.restype = ctypes.c_int
+    _statx = func
+    _STATX_AVAILABLE = True
+
+def _fast_stat(entry: os.DirEntry) -> _FastStat:
+    """Size and mtime of a directory entry, following symlinks, via statx(2) where available"""
+    global _STATX_AVAILABLE
+    if _STATX_AVAILABLE is None:
+        _load_statx()
+    
+    if _STATX_AVAILABLE:
+        buf = _Statx()
+        wanted = _STATX_SIZE | _STATX_MTIME
+        if _statx(_AT_FDCWD, os.fsencode(entry.path), _AT_STATX_DONT_SYNC, wanted, ctypes.byref(buf)) == 0:
+            if buf.stx_mask & wanted == wanted:
+                mtime = buf.stx_mtime
+                return _FastStat(buf.stx_size, mtime.tv_sec + mtime.tv_nsec * 1e-9)
+        else:
+            err = ctypes.get_errno()
+            if err not in (errno.ENOSYS, errno.EPERM):
+                raise OSError(err, os.strerror(err), entry.path)
+            # Kernel older than 4.11, or statx blocked by a seccomp filter
+            _STATX_AVAILABLE = False
+    
+    stat = entry.stat()
+    return _FastStat(stat.st_size, stat.st_mtime)
+
 class ARCSECShell(cmd.Cmd):
     """Interactive ARCSEC management shell"""
     
@@ -42,9 +184,22 @@ Type 'exit' or 'quit' to exit the shell.
         self.last_updated = "2025-07-30T20:00:00Z"
         self.protection_level = "WAR_MODE_MAXIMUM"
         
-        # Shell state
+        # Shell state; current_directory tracks the cwd and is only changed by do_cd
         self.current_directory = os.getcwd()
-        self.command_history = []
+        self._home = os.path.expanduser("~")
+        # (st_dev, st_ino, st_mtime_ns) of the last directory counted by do_status, and its count
+        self._arcsec_count_cache = (None, 0)
+        
+        # Tool scripts live next to the shell; resolve them once so 'cd' can't break them
+        self._py = sys.executable
+        base = Path(__file__).resolve().parent
+        self._tools = {tool: str(base / f"{tool}.py") for tool in TOOLS}
+        
+        # Tool modules imported so far, reused by every later command
+        self._tool_modules = {}
+        
+        # Only the most recent commands are kept
+        self.command_history = deque(maxlen=1000)
         self.aliases = {
             "ls": "list",
             "ll": "list -l",
@@ -52,48 +207,198 @@ Type 'exit' or 'quit' to exit the shell.
             "clear": "cls",
             "exit": "quit"
         }
+        self._rebuild_aliases()
         
-        # Setup history file
+        # Setup history file; it is read just before the first prompt, and only
+        # its last max_history_length entries are kept
         self.history_file = ".arcsec_history"
-        self.load_history()
+        self.max_history_length = 5000
+        self._history_loaded = False
+        self._initial_history_len = 0
         atexit.register(self.save_history)
     
+    def preloop(self):
+        """Load command history before the first prompt"""
+        self.load_history()
+    
     def load_history(self):
-        """Load command history"""
+        """Load the most recent max_history_length entries of the command history"""
+        if self._history_loaded:
+            return
+        self._history_loaded = True
+        
         try:
+            readline.set_history_length(self.max_history_length)
             if os.path.exists(self.history_file):
-                readline.read_history_file(self.history_file)
+                with open(self.history_file, 'rb') as f:
+                    tail = self._history_tail(f)
+                
+                if tail is None:
+                    readline.read_history_file(self.history_file)
+                else:
+                    # Hand readline only the tail
+                    with tempfile.NamedTemporaryFile('wb', suffix='.history', delete=False) as tmp:
+                        tmp.writelines(tail)
+                    try:
+                        readline.read_history_file(tmp.name)
+                    finally:
+                        os.unlink(tmp.name)
         except Exception:
             pass
+        
+        # save_history compares against this to tell whether anything was added
+        self._initial_history_len = readline.get_current_history_length()
+    
+    def _history_tail(self, f) -> Optional[List[bytes]]:
+        """Last max_history_length lines of a history file, or None if it holds no more than that
+        
+        The file is read backwards in blocks, so a long history costs only its tail.
+        """
+        limit = self.max_history_length
+        blocks = []
+        newlines = 0
+        position = f.seek(0, os.SEEK_END)
+        # More newlines than the limit means the tail lines are all complete
+        while position > 0 and newlines <= limit:
+            size = min(64 << 10, position)
+            position -= size
+            f.seek(position)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+        
+        lines = b"".join(reversed(blocks)).splitlines(keepends=True)
+        if position == 0 and len(lines) <= limit:
+            return None
+        
+        tail = lines[-limit:]
+        # Keep libedit's format header if present
+        f.seek(0)
+        header = f.readline(64)
+        if header.startswith(b"_HiStOrY_V2_"):
+            tail.insert(0, header)
+        return tail
     
     def save_history(self):
         """Save command history"""
+        # A shell that never prompted holds no history; writing would wipe the file.
+        # A session that added no commands has nothing new to write
+        if (not self._history_loaded
+                or readline.get_current_history_length() == self._initial_history_len):
+            return
         try:
             readline.write_history_file(self.history_file)
         except Exception:
             pass
     
+    def _run_tool(self, tool: str, *args: str) -> subprocess.CompletedProcess:
+        """Run an ARCSEC tool's main() with captured output, in-process unless it is isolated"""
+        argv = [self._tools[tool], *args]
+        module = self._tool_modules.get(tool)
+        if module is None and tool not in ISOLATED_TOOLS:
+            try:
+                module = self._tool_modules[tool] = importlib.import_module(tool)
+            except ImportError:
+                # Let the child process report what is missing
+                module = None
+        if module is None:
+            # Child output stays undecoded bytes; _echo passes it through
+            return subprocess.run([self._py, *argv], capture_output=True)
+        
+        # Saves an interpreter start and the tool's imports on every command
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv = sys.argv
+        saved_handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+        returncode = 0
+        sys.argv = argv
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    module.main()
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        returncode = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        returncode = 1
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+        finally:
+            sys.argv = saved_argv
+            for sig, handler in saved_handlers.items():
+                signal.signal(sig, handler)
+        
+        return subprocess.CompletedProcess(argv, returncode, stdout.getvalue(), stderr.getvalue())
+    
+    def _read_manifest_summary(self, manifest_file: str) -> Dict[str, Any]:
+        """Read the MANIFEST_SUMMARY_FIELDS present in a manifest, keyed by dotted path"""
+        values = {}
+        if ijson is not None:
+            # Stop at the last wanted scalar instead of building the whole manifest
+            with open(manifest_file, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix in MANIFEST_SUMMARY_FIELDS and event not in ("start_map", "start_array"):
+                        values[prefix] = value
+                        if len(values) == len(MANIFEST_SUMMARY_FIELDS):
+                            break
+            return values
+        
+        with open(manifest_file, 'r') as f:
+            data = json.load(f)
+        for path in MANIFEST_SUMMARY_FIELDS:
+            node = data
+            for key in path.split('.'):
+                if not isinstance(node, dict) or key not in node:
+                    break
+                node = node[key]
+            else:
+                values[path] = node
+        return values
+    
+    def _rebuild_aliases(self):
+        """Split every alias into (command, prefix arguments or None) once, for parseline"""
+        self._alias_expanded = {}
+        for name, alias_cmd in self.aliases.items():
+            if ' ' in alias_cmd:
+                command, prefix = alias_cmd.split(' ', 1)
+                self._alias_expanded[name] = (command, prefix)
+            else:
+                self._alias_expanded[name] = (alias_cmd, None)
+    
+    def _echo(self, output):
+        """Print captured output and a newline; bytes go straight to the stdout buffer undecoded"""
+        if isinstance(output, bytes):
+            buffer = getattr(sys.stdout, 'buffer', None)
+            if buffer is None:
+                output = output.decode(errors='replace')
+            else:
+                # Flush pending text first so the raw bytes land in order
+                sys.stdout.flush()
+                buffer.write(output)
+                buffer.write(b"\n")
+                return
+        print(output)
+    
     def parseline(self, line):
         """Parse command line with alias support"""
         cmd, arg, line = super().parseline(line)
         
-        if cmd in self.aliases:
+        expanded = self._alias_expanded.get(cmd)
+        if expanded:
             # Replace alias with actual command
-            alias_cmd = self.aliases[cmd]
-            if ' ' in alias_cmd:
-                parts = alias_cmd.split(' ', 1)
-                cmd = parts[0]
-                arg = f"{parts[1]} {arg}".strip()
-            else:
-                cmd = alias_cmd
+            cmd, prefix = expanded
+            if prefix:
+                arg = f"{prefix} {arg}".strip()
         
         return cmd, arg, line
     
     def precmd(self, line):
         """Pre-process command"""
         if line.strip():
+            # Raw timestamp; do_history formats the few entries it shows
             self.command_history.append({
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "ts_ns": time.time_ns(),
                 "command": line.strip()
             })
         return line
@@ -104,13 +409,12 @@ Type 'exit' or 'quit' to exit the shell.
             print("🔍 ARCSEC System Status:")
             print(f"   Version: {self.version}")
             print(f"   Creator: {self.creator}")
-            print(f"   Current Directory: {os.getcwd()}")
+            print(f"   Current Directory: {self.current_directory}")
             print(f"   Protection Status: WAR MODE ACTIVE")
             print(f"   Digital Signature: {self.digital_signature}")
             
             # Check for ARCSEC files in current directory
-            arcsec_files = [f for f in os.listdir('.') if 'arcsec' in f.lower()]
-            print(f"   ARCSEC Files: {len(arcsec_files)}")
+            print(f"   ARCSEC Files: {self._count_arcsec_files()}")
             
             # Check for manifest
             if os.path.exists("ARCSEC_FINGERPRINT_MANIFEST.json"):
@@ -121,52 +425,82 @@ Type 'exit' or 'quit' to exit the shell.
         except Exception as e:
             print(f"❌ Error getting status: {e}")
     
+    def _count_arcsec_files(self) -> int:
+        """Count ARCSEC entries in the current directory, reusing the last count while it is unchanged"""
+        stat = os.stat('.')
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        cached_key, count = self._arcsec_count_cache
+        if key == cached_key:
+            return count
+        
+        with os.scandir('.') as entries:
+            count = sum(1 for entry in entries if 'arcsec' in entry.name.lower())
+        
+        # Entries added within the timestamp granularity may not move the mtime,
+        # so only cache directories that have been quiet for a second
+        if time.time_ns() - stat.st_mtime_ns > 1_000_000_000:
+            self._arcsec_count_cache = (key, count)
+        return count
+    
     def do_list(self, arg):
         """List files and directories with ARCSEC highlighting
         Usage: list [-l] [path]
         """
         try:
-            args = shlex.split(arg) if arg else []
+            args = _split_args(arg)
             long_format = '-l' in args
             path = next((a for a in args if not a.startswith('-')), '.')
             
-            if not os.path.exists(path):
+            # One directory read; DirEntry reuses the file type and stat it returns,
+            # and a missing path surfaces here without a separate exists() check
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except FileNotFoundError:
                 print(f"❌ Path not found: {path}")
                 return
+            entries.sort(key=lambda entry: entry.name)
             
-            items = sorted(os.listdir(path))
-            
-            print(f"📁 Contents of {os.path.abspath(path)}:")
-            
-            for item in items:
-                item_path = os.path.join(path, item)
-                
-                if os.path.isdir(item_path):
-                    icon = "📁"
-                    item_name = f"{item}/"
-                elif 'arcsec' in item.lower():
-                    icon = "🛡️ "
-                    item_name = item
-                elif item.endswith(('.json', '.yml', '.yaml')):
-                    icon = "📄"
-                    item_name = item
-                elif item.endswith(('.py', '.ts', '.js')):
-                    icon = "📝"
-                    item_name = item
-                else:
-                    icon = "📄"
-                    item_name = item
-                
-                if long_format and os.path.exists(item_path):
-                    try:
-                        stat = os.stat(item_path)
-                        size = stat.st_size
-                        modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-                        print(f"   {icon} {item_name:<30} {size:>8} bytes  {modified}")
-                    except Exception:
-                        print(f"   {icon} {item_name}")
-                else:
-                    print(f"   {icon} {item_name}")
+            # os.path.abspath without its getcwd() call
+            if path == '.':
+                shown_path = self.current_directory
+            else:
+                shown_path = os.path.normpath(os.path.join(self.current_directory, path))
+            # Collect the listing and write it once instead of a print per entry
+            out = [f"📁 Contents of {shown_path}:"]
+            # Neighbouring files often share a modification minute; format each minute once
+            last_minute = None
+            modified = ""
+            try:
+                for entry in entries:
+                    item = entry.name
+                    
+                    if entry.is_dir():
+                        icon = "📁"
+                        item_name = f"{item}/"
+                    else:
+                        item_name = item
+                        if 'arcsec' in item.lower():
+                            icon = "🛡️ "
+                        else:
+                            dot = item.rfind('.')
+                            icon = _EXT_ICON.get(item[dot:], "📄") if dot >= 0 else "📄"
+                    
+                    if long_format:
+                        try:
+                            stat = _fast_stat(entry)
+                            size = stat.st_size
+                            minute = int(stat.st_mtime) // 60
+                            if minute != last_minute:
+                                modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime))
+                                last_minute = minute
+                            out.append(f"   {icon} {item_name:<30} {size:>8} bytes  {modified}")
+                        except Exception:
+                            out.append(f"   {icon} {item_name}")
+                    else:
+                        out.append(f"   {icon} {item_name}")
+            finally:
+                sys.stdout.write("\n".join(out) + "\n")
                     
         except Exception as e:
             print(f"❌ Error listing files: {e}")
@@ -176,8 +510,7 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: cd <path>
         """
         try:
-            if not arg:
-                arg = os.path.expanduser("~")
+            arg = arg or self._home
             
             new_path = os.path.abspath(arg)
             
@@ -193,7 +526,7 @@ Type 'exit' or 'quit' to exit the shell.
     
     def do_cwd(self, arg):
         """Show current working directory"""
-        print(f"📁 Current directory: {os.getcwd()}")
+        print(f"📁 Current directory: {self.current_directory}")
     
     def do_fingerprint(self, arg):
         """Generate ARCSEC fingerprints
@@ -204,31 +537,29 @@ Type 'exit' or 'quit' to exit the shell.
             
             if action == "scan":
                 print("🔍 Generating ARCSEC fingerprints...")
-                result = subprocess.run([sys.executable, "arcsec_fingerprint.py"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_fingerprint")
                 
                 if result.returncode == 0:
                     print("✅ Fingerprinting completed successfully")
                     if result.stdout:
-                        print(result.stdout)
+                        self._echo(result.stdout)
                 else:
                     print("❌ Fingerprinting failed")
                     if result.stderr:
-                        print(result.stderr)
+                        self._echo(result.stderr)
             
             elif action == "verify":
                 print("🔐 Verifying ARCSEC fingerprints...")
-                result = subprocess.run([sys.executable, "arcsec_injector.py", "--verify"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_injector", "--verify")
                 
                 if result.returncode == 0:
                     print("✅ Verification completed")
                     if result.stdout:
-                        print(result.stdout)
+                        self._echo(result.stdout)
                 else:
                     print("❌ Verification failed")
                     if result.stderr:
-                        print(result.stderr)
+                        self._echo(result.stderr)
             
             else:
                 print(f"❌ Unknown action: {action}")
@@ -246,34 +577,26 @@ Type 'exit' or 'quit' to exit the shell.
             
             if action == "generate":
                 print("📋 Generating project manifest...")
-                result = subprocess.run([sys.executable, "arcsec_manifest_generator.py"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_manifest_generator")
                 
                 if result.returncode == 0:
                     print("✅ Manifest generated successfully")
                 else:
                     print("❌ Manifest generation failed")
                     if result.stderr:
-                        print(result.stderr)
+                        self._echo(result.stderr)
             
             elif action == "view":
                 manifest_file = "ARCSEC_PROJECT_MANIFEST.json"
                 if os.path.exists(manifest_file):
-                    with open(manifest_file, 'r') as f:
-                        data = json.load(f)
+                    values = self._read_manifest_summary(manifest_file)
                     
                     print("📋 Project Manifest Summary:")
-                    metadata = data.get("arcsec_manifest_metadata", {})
-                    print(f"   Generated: {metadata.get('generated')}")
-                    print(f"   Creator: {metadata.get('creator')}")
-                    
-                    structure = data.get("project_structure", {})
-                    print(f"   Total Files: {structure.get('total_files', 0)}")
-                    print(f"   Total Directories: {structure.get('total_directories', 0)}")
-                    
-                    ecosystem = data.get("arcsec_ecosystem", {})
-                    summary = ecosystem.get("summary", {})
-                    print(f"   ARCSEC Files: {summary.get('total_arcsec_files', 0)}")
+                    print(f"   Generated: {values.get('arcsec_manifest_metadata.generated')}")
+                    print(f"   Creator: {values.get('arcsec_manifest_metadata.creator')}")
+                    print(f"   Total Files: {values.get('project_structure.total_files', 0)}")
+                    print(f"   Total Directories: {values.get('project_structure.total_directories', 0)}")
+                    print(f"   ARCSEC Files: {values.get('arcsec_ecosystem.summary.total_arcsec_files', 0)}")
                 else:
                     print("❌ No manifest file found. Run 'manifest generate' first.")
             
@@ -289,33 +612,31 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: inject [monitor|process <file>|validate]
         """
         try:
-            args = shlex.split(arg) if arg else []
+            args = _split_args(arg)
             action = args[0] if args else "validate"
             
             if action == "monitor":
                 print("👁️  Starting ARCSEC auto-injection monitoring...")
                 print("Press Ctrl+C to stop monitoring")
-                subprocess.run([sys.executable, "arcsec_auto_injection_hook.py", "--monitor"])
+                subprocess.run([self._py, self._tools["arcsec_auto_injection_hook"], "--monitor"])
             
             elif action == "process" and len(args) > 1:
                 file_path = args[1]
                 print(f"🔄 Processing file: {file_path}")
-                result = subprocess.run([sys.executable, "arcsec_auto_injection_hook.py", "--process", file_path], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_auto_injection_hook", "--process", file_path)
                 
                 if result.returncode == 0:
                     print("✅ File processed successfully")
                     if result.stdout:
-                        print(result.stdout)
+                        self._echo(result.stdout)
                 else:
                     print("❌ File processing failed")
                     if result.stderr:
-                        print(result.stderr)
+                        self._echo(result.stderr)
             
             elif action == "validate":
                 print("🔍 Validating ARCSEC naming compliance...")
-                result = subprocess.run([sys.executable, "arcsec_injector.py", "--validate"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_injector", "--validate")
                 
                 if result.returncode == 0:
                     print("✅ Validation passed")
@@ -323,9 +644,9 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Validation failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             else:
                 print("Available actions:")
@@ -343,13 +664,12 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: sign [scan|verify|file <path>]
         """
         try:
-            args = shlex.split(arg) if arg else []
+            args = _split_args(arg)
             action = args[0] if args else "scan"
             
             if action == "scan":
                 print("📝 Scanning and signing ARCSEC files...")
-                result = subprocess.run([sys.executable, "arcsec_signature_imprinter.py", "--scan"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_signature_imprinter", "--scan")
                 
                 if result.returncode == 0:
                     print("✅ Signing completed")
@@ -357,12 +677,11 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Signing failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
             
             elif action == "verify":
                 print("🔍 Verifying ARCSEC signatures...")
-                result = subprocess.run([sys.executable, "arcsec_signature_imprinter.py", "--verify"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_signature_imprinter", "--verify")
                 
                 if result.returncode == 0:
                     print("✅ Verification completed")
@@ -370,13 +689,12 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Verification failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
             
             elif action == "file" and len(args) > 1:
                 file_path = args[1]
                 print(f"📝 Signing file: {file_path}")
-                result = subprocess.run([sys.executable, "arcsec_signature_imprinter.py", "--file", file_path], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_signature_imprinter", "--file", file_path)
                 
                 if result.returncode == 0:
                     print("✅ File signed successfully")
@@ -384,9 +702,9 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ File signing failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             else:
                 print("Available actions:")
@@ -402,7 +720,7 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: convert <input> <output> <type>
         """
         try:
-            args = shlex.split(arg)
+            args = _split_args(arg)
             
             if len(args) < 3:
                 print("Usage: convert <input> <output> <type>")
@@ -412,12 +730,12 @@ Type 'exit' or 'quit' to exit the shell.
             input_file, output_file, conv_type = args[0], args[1], args[2]
             
             print(f"🔄 Converting {input_file} -> {output_file} ({conv_type})")
-            result = subprocess.run([
-                sys.executable, "arcsec_converter.py", 
+            result = self._run_tool(
+                "arcsec_converter",
                 "--convert", input_file,
                 "--output", output_file,
                 "--type", conv_type
-            ], capture_output=True, text=True)
+            )
             
             if result.returncode == 0:
                 print("✅ Conversion completed")
@@ -425,9 +743,9 @@ Type 'exit' or 'quit' to exit the shell.
                 print("❌ Conversion failed")
                 
             if result.stdout:
-                print(result.stdout)
+                self._echo(result.stdout)
             if result.stderr:
-                print(result.stderr)
+                self._echo(result.stderr)
                 
         except Exception as e:
             print(f"❌ Error with conversion: {e}")
@@ -437,15 +755,12 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: token [create|validate|list|revoke] [options]
         """
         try:
-            args = shlex.split(arg) if arg else []
+            args = _split_args(arg)
             action = args[0] if args else "list"
             
             if action == "create" and len(args) >= 4:
                 token_type, subject, scopes = args[1], args[2], args[3]
-                result = subprocess.run([
-                    sys.executable, "arcsec_token_creator.py",
-                    "--create", f"{token_type}:{subject}:{scopes}"
-                ], capture_output=True, text=True)
+                result = self._run_tool("arcsec_token_creator", "--create", f"{token_type}:{subject}:{scopes}")
                 
                 if result.returncode == 0:
                     print("✅ Token created")
@@ -453,28 +768,26 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Token creation failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             elif action == "list":
-                result = subprocess.run([sys.executable, "arcsec_token_creator.py", "--list"], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_token_creator", "--list")
                 
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             elif action == "validate" and len(args) > 1:
                 token = args[1]
-                result = subprocess.run([sys.executable, "arcsec_token_creator.py", "--validate", token], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_token_creator", "--validate", token)
                 
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             else:
                 print("Available actions:")
@@ -491,7 +804,7 @@ Type 'exit' or 'quit' to exit the shell.
         Usage: pack [create|extract|validate] [options]
         """
         try:
-            args = shlex.split(arg) if arg else []
+            args = _split_args(arg)
             action = args[0] if args else "create"
             
             if action == "create":
@@ -499,11 +812,11 @@ Type 'exit' or 'quit' to exit the shell.
                 output = args[2] if len(args) > 2 else "arcsec_package.tar.gz"
                 
                 print(f"📦 Creating package: {source} -> {output}")
-                result = subprocess.run([
-                    sys.executable, "arcsec_packager.py",
+                result = self._run_tool(
+                    "arcsec_packager",
                     "--create", source,
                     "--output", output
-                ], capture_output=True, text=True)
+                )
                 
                 if result.returncode == 0:
                     print("✅ Package created")
@@ -511,20 +824,20 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Package creation failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             elif action == "extract" and len(args) > 1:
                 package = args[1]
                 output_dir = args[2] if len(args) > 2 else "extracted"
                 
                 print(f"📤 Extracting package: {package} -> {output_dir}")
-                result = subprocess.run([
-                    sys.executable, "arcsec_packager.py",
+                result = self._run_tool(
+                    "arcsec_packager",
                     "--extract", package,
                     "--output", output_dir
-                ], capture_output=True, text=True)
+                )
                 
                 if result.returncode == 0:
                     print("✅ Package extracted")
@@ -532,19 +845,18 @@ Type 'exit' or 'quit' to exit the shell.
                     print("❌ Package extraction failed")
                     
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             elif action == "validate" and len(args) > 1:
                 package = args[1]
-                result = subprocess.run([sys.executable, "arcsec_packager.py", "--validate", package], 
-                                      capture_output=True, text=True)
+                result = self._run_tool("arcsec_packager", "--validate", package)
                 
                 if result.stdout:
-                    print(result.stdout)
+                    self._echo(result.stdout)
                 if result.stderr:
-                    print(result.stderr)
+                    self._echo(result.stderr)
             
             else:
                 print("Available actions:")
@@ -557,10 +869,17 @@ Type 'exit' or 'quit' to exit the shell.
     
     def do_history(self, arg):
         """Show command history"""
-        print("📜 Command History:")
-        for i, entry in enumerate(self.command_history[-20:], 1):  # Last 20 commands
-            timestamp = entry["timestamp"][:19]  # Remove microseconds
-            print(f"   {i:2d}. [{timestamp}] {entry['command']}")
+        # Last 20 commands, taken from the right end of the deque so the
+        # older entries are never walked
+        recent = list(itertools.islice(reversed(self.command_history), 20))
+        recent.reverse()
+        
+        lines = ["📜 Command History:"]
+        for i, entry in enumerate(recent, 1):
+            timestamp = datetime.fromtimestamp(entry["ts_ns"] // 1_000_000_000,
+                                               tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            lines.append(f"   {i:2d}. [{timestamp}] {entry['command']}")
+        print("\n".join(lines))
     
     def do_alias(self, arg):
         """Manage command aliases
@@ -577,6 +896,7 @@ Type 'exit' or 'quit' to exit the shell.
             name = name.strip()
             command = command.strip()
             self.aliases[name] = command
+            self._rebuild_aliases()
             print(f"✅ Alias set: {name} = {command}")
         else:
             # Show specific alias
@@ -588,7 +908,13 @@ Type 'exit' or 'quit' to exit the shell.
     
     def do_cls(self, arg):
         """Clear the screen"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        if os.name == 'posix' or os.environ.get('WT_SESSION') or os.environ.get('TERM'):
+            # Home, clear screen, clear scrollback: what clear(1) emits, without a fork
+            sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+            sys.stdout.flush()
+        else:
+            # Legacy Windows console without ANSI support
+            os.system('cls')
     
     def do_exec(self, arg):
         """Execute system command
@@ -600,12 +926,12 @@ Type 'exit' or 'quit' to exit the shell.
         
         try:
             print(f"⚡ Executing: {arg}")
-            result = subprocess.run(arg, shell=True, capture_output=True, text=True)
+            result = subprocess.run(arg, shell=True, capture_output=True)
             
             if result.stdout:
-                print(result.stdout)
+                self._echo(result.stdout)
             if result.stderr:
-                print(result.stderr)
+                self._echo(result.stderr)
                 
             if result.returncode != 0:
                 print(f"❌ Command failed with exit code {result.returncode}")
@@ -9,9 +9,120 @@ Digital Signature: a6672edf248c5eeef3054ecca057075c938af653
 import os
 import re
 import json
+import codecs
+import mmap
+import stat
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from arcsec_common import file_extension, json_decode, json_dumps
+
+# File type by lowercase extension
+FILE_TYPES = {
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.py': 'python',
+    '.json': 'json',
+    '.md': 'markdown',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.sh': 'shell',
+    '.bash': 'shell',
+    '.sql': 'sql'
+}
+
+# Build and tool directories never scanned for ARCSEC files
+SKIP_DIRS = frozenset({'node_modules', 'dist', '__pycache__'})
+
+# File description by name fragment, highest priority first: the known ARCSEC
+# components, then generic fallbacks by role
+FILE_DESCRIPTIONS = (
+    ('arcsec-universal-handler', 'Universal ARCSEC protection and coordination system'),
+    ('arcsec-master-controller', 'ARCSEC master control and orchestration engine'),
+    ('arcsec-security', 'Advanced security monitoring and threat detection'),
+    ('arcsec-safety', 'Safety monitoring, compliance, and risk management system'),
+    ('arcsec-store', 'Advanced data storage with partitions and caching'),
+    ('arcsec-bus', 'Message routing and event system with channels'),
+    ('arcsec-api-management', 'API gateway with rate limiting and monitoring'),
+    ('arcsec-health-monitor', 'System health monitoring and diagnostics'),
+    ('arcsec-search-engine', 'Advanced search and knowledge discovery system'),
+    ('arcsec-memory-recall', 'Knowledge management and context preservation'),
+    ('arcsec-dev', 'Development environment management and deployment automation'),
+    ('arcsec_fingerprint', 'Cryptographic file verification and tamper detection system'),
+    ('arcsec_injector', 'Runtime enforcement and tamper prevention system'),
+    ('arcsec_manifest_generator', 'Advanced file mapping, hash generation, and metadata collection system'),
+    ('service', 'ARCSEC service component'),
+    ('controller', 'ARCSEC control system component'),
+    ('processor', 'ARCSEC data processing component'),
+    ('engine', 'ARCSEC processing engine component')
+)
+
+# One compiled matcher labelling a lowercase filename with the index of its
+# highest-priority fragment; each alternative is a lookahead from the start of
+# the name, so a later fragment of a higher entry still wins
+DESCRIPTION_CLASSIFIER = re.compile(
+    "|".join(f"(?=.*?(?P<d{i}>{re.escape(fragment)}))"
+             for i, (fragment, _) in enumerate(FILE_DESCRIPTIONS)),
+    re.DOTALL
+)
+
+# Signatures are always prepended, so detection only looks at this many leading
+# characters of decoded content, or bytes of raw content
+SIGNATURE_HEADER_SIZE = 4096
+
+# Literal every existing signature of a file type contains
+SIGNATURE_MARKERS = {
+    'typescript': 'Digital Signature:',
+    'javascript': 'Digital Signature:',
+    'python': 'Digital Signature:',
+    'json': '"digital_signature"',
+    'markdown': 'Digital Signature:',
+    'yaml': '# Digital Signature:',
+    'shell': '# Digital Signature:',
+    'sql': '-- Digital Signature:'
+}
+
+# Block-comment patterns confirming the marker sits inside a signature comment;
+# for the other file types the marker alone is the signature
+SIGNATURE_PATTERNS = {
+    file_type: re.compile(pattern, re.DOTALL)
+    for file_type, pattern in {
+        'typescript': r'/\*\*.*Digital Signature:.*\*/',
+        'javascript': r'/\*\*.*Digital Signature:.*\*/',
+        'python': r'""".*Digital Signature:.*"""',
+        'markdown': r'<!--.*Digital Signature:.*-->'
+    }.items()
+}
+
+# The same markers and patterns for matching raw file bytes; all are ASCII, so
+# they match the UTF-8 encoding exactly where they match the decoded text
+SIGNATURE_MARKERS_BYTES = {
+    file_type: marker.encode('ascii') for file_type, marker in SIGNATURE_MARKERS.items()
+}
+SIGNATURE_PATTERNS_BYTES = {
+    file_type: re.compile(pattern.pattern.encode('ascii'), re.DOTALL)
+    for file_type, pattern in SIGNATURE_PATTERNS.items()
+}
+
+# Signature block removal patterns by file type
+SIGNATURE_BLOCKS = {
+    file_type: re.compile(pattern, re.MULTILINE)
+    for file_type, pattern in {
+        'typescript': r'/\*\*[\s\S]*?Digital Signature:[\s\S]*?\*/',
+        'javascript': r'/\*\*[\s\S]*?Digital Signature:[\s\S]*?\*/',
+        'python': r'"""[\s\S]*?Digital Signature:[\s\S]*?"""',
+        'markdown': r'<!--[\s\S]*?Digital Signature:[\s\S]*?-->',
+        'yaml': r'#[^\n]*Digital Signature:[^\n]*\n',
+        'shell': r'#[^\n]*Digital Signature:[^\n]*\n',
+        'sql': r'--[^\n]*Digital Signature:[^\n]*\n'
+    }.items()
+}
 
 class ARCSECSignatureImprinter:
     def __init__(self):
@@ -21,6 +132,52 @@ class ARCSECSignatureImprinter:
         self.last_updated = "2025-07-30T20:00:00Z"
         self.protection_level = "WAR_MODE_MAXIMUM"
         self.copyright_year = "2025"
+        self.mmap_min_size = 1 << 20
+        
+        # Signature headers with everything but filename and description filled in
+        copyright_notice = f"© {self.copyright_year} {self.creator} - All Rights Reserved"
+        self._typescript_template = f'''/**
+ * {{}}
+ * {{}}
+ * {copyright_notice}
+ * Digital Signature: {self.digital_signature}
+ */'''
+        self._python_template = f'''#!/usr/bin/env python3
+"""
+{{}}
+{{}}
+{copyright_notice}
+Digital Signature: {self.digital_signature}
+"""'''
+        self._markdown_template = f'''<!--
+{{}}
+{{}}
+{copyright_notice}
+Digital Signature: {self.digital_signature}
+-->'''
+        self._yaml_template = f'''# {{}}
+# {{}}
+# {copyright_notice}
+# Digital Signature: {self.digital_signature}'''
+        self._shell_template = f'''#!/bin/bash
+# {{}}
+# {{}}
+# {copyright_notice}
+# Digital Signature: {self.digital_signature}'''
+        self._sql_template = f'''-- {{}}
+-- {{}}
+-- {copyright_notice}
+-- Digital Signature: {self.digital_signature}'''
+        self._json_metadata = {
+            "filename": None,
+            "description": None,
+            "creator": self.creator,
+            "copyright": copyright_notice,
+            "digital_signature": self.digital_signature,
+            "version": self.version,
+            "created": None,
+            "protection_level": "ARCSEC_PROTECTED"
+        }
         
         # Signature templates for different file types
         self.signature_templates = {
@@ -36,33 +193,12 @@ class ARCSECSignatureImprinter:
         
     def get_file_type(self, filepath: str) -> str:
         """Determine file type based on extension"""
-        ext = Path(filepath).suffix.lower()
-        
-        type_map = {
-            '.ts': 'typescript',
-            '.tsx': 'typescript',
-            '.js': 'javascript',
-            '.jsx': 'javascript',
-            '.py': 'python',
-            '.json': 'json',
-            '.md': 'markdown',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.sh': 'shell',
-            '.bash': 'shell',
-            '.sql': 'sql'
-        }
-        
-        return type_map.get(ext, 'unknown')
+        ext = file_extension(os.path.basename(filepath)).lower()
+        return FILE_TYPES.get(ext, 'unknown')
     
     def get_typescript_signature(self, filename: str, description: str = "") -> str:
         """Generate TypeScript/JavaScript signature header"""
-        return f'''/**
- * {filename}
- * {description}
- * © {self.copyright_year} {self.creator} - All Rights Reserved
- * Digital Signature: {self.digital_signature}
- */'''
+        return self._typescript_template.format(filename, description)
     
     def get_javascript_signature(self, filename: str, description: str = "") -> str:
         """Generate JavaScript signature header"""
@@ -70,115 +206,110 @@ class ARCSECSignatureImprinter:
     
     def get_python_signature(self, filename: str, description: str = "") -> str:
         """Generate Python signature header"""
-        return f'''#!/usr/bin/env python3
-"""
-{filename}
-{description}
-© {self.copyright_year} {self.creator} - All Rights Reserved
-Digital Signature: {self.digital_signature}
-"""'''
+        return self._python_template.format(filename, description)
     
     def get_json_signature(self, filename: str, description: str = "") -> Dict[str, Any]:
         """Generate JSON signature metadata"""
-        return {
-            "_arcsec_metadata": {
-                "filename": filename,
-                "description": description,
-                "creator": self.creator,
-                "copyright": f"© {self.copyright_year} {self.creator} - All Rights Reserved",
-                "digital_signature": self.digital_signature,
-                "version": self.version,
-                "created": datetime.now(timezone.utc).isoformat(),
-                "protection_level": "ARCSEC_PROTECTED"
-            }
-        }
+        metadata = self._json_metadata.copy()
+        metadata["filename"] = filename
+        metadata["description"] = description
+        metadata["created"] = datetime.now(timezone.utc).isoformat()
+        return {"_arcsec_metadata": metadata}
     
     def get_markdown_signature(self, filename: str, description: str = "") -> str:
         """Generate Markdown signature header"""
-        return f'''<!--
-{filename}
-{description}
-© {self.copyright_year} {self.creator} - All Rights Reserved
-Digital Signature: {self.digital_signature}
--->'''
+        return self._markdown_template.format(filename, description)
     
     def get_yaml_signature(self, filename: str, description: str = "") -> str:
         """Generate YAML signature header"""
-        return f'''# {filename}
-# {description}
-# © {self.copyright_year} {self.creator} - All Rights Reserved
-# Digital Signature: {self.digital_signature}'''
+        return self._yaml_template.format(filename, description)
     
     def get_shell_signature(self, filename: str, description: str = "") -> str:
         """Generate Shell script signature header"""
-        return f'''#!/bin/bash
-# {filename}
-# {description}
-# © {self.copyright_year} {self.creator} - All Rights Reserved
-# Digital Signature: {self.digital_signature}'''
+        return self._shell_template.format(filename, description)
     
     def get_sql_signature(self, filename: str, description: str = "") -> str:
         """Generate SQL signature header"""
-        return f'''-- {filename}
--- {description}
--- © {self.copyright_year} {self.creator} - All Rights Reserved
--- Digital Signature: {self.digital_signature}'''
+        return self._sql_template.format(filename, description)
     
-    def has_existing_signature(self, content: str, file_type: str) -> bool:
-        """Check if file already has ARCSEC signature"""
-        signature_patterns = {
-            'typescript': r'/\*\*.*Digital Signature:.*\*/',
-            'javascript': r'/\*\*.*Digital Signature:.*\*/',
-            'python': r'""".*Digital Signature:.*"""',
-            'json': r'"digital_signature"',
-            'markdown': r'<!--.*Digital Signature:.*-->',
-            'yaml': r'# Digital Signature:',
-            'shell': r'# Digital Signature:',
-            'sql': r'-- Digital Signature:'
-        }
+    def has_existing_signature(self, content: Union[str, bytes, mmap.mmap], file_type: str) -> bool:
+        """Check if file already has ARCSEC signature in its header"""
+        content = content[:SIGNATURE_HEADER_SIZE]
+        if isinstance(content, str):
+            markers, patterns = SIGNATURE_MARKERS, SIGNATURE_PATTERNS
+        else:
+            markers, patterns = SIGNATURE_MARKERS_BYTES, SIGNATURE_PATTERNS_BYTES
         
-        pattern = signature_patterns.get(file_type)
-        if pattern:
-            return bool(re.search(pattern, content, re.DOTALL))
+        marker = markers.get(file_type)
+        if marker is None or marker not in content:
+            return False
         
-        return False
+        pattern = patterns.get(file_type)
+        return pattern is None or bool(pattern.search(content))
+    
+    def _read_file_bytes(self, filepath: str) -> bytes:
+        """Read a file's raw bytes, raising the same error a UTF-8 text read would on invalid content"""
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        
+        # ASCII is valid UTF-8, so only other content needs a validating decode
+        if not data.isascii():
+            data.decode('utf-8')
+        return data
+    
+    def _check_utf8(self, data) -> None:
+        """Raise the error a UTF-8 text read would on invalid content, 1 MiB at a time"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for start in range(0, len(data), 1 << 20):
+            chunk = data[start:start + (1 << 20)]
+            # ASCII is valid UTF-8 unless it follows an unfinished multi-byte sequence
+            if not chunk.isascii() or decoder.getstate()[0]:
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    
+    @contextmanager
+    def _file_content(self, filepath: str):
+        """Yield a file's bytes for scanning; files over mmap_min_size are memory-mapped instead of read
+        
+        Either way the content is checked to be UTF-8, as the text read it replaces did.
+        """
+        with open(filepath, 'rb') as f:
+            mm = None
+            if os.fstat(f.fileno()).st_size > self.mmap_min_size:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    pass
+            
+            if mm is None:
+                data = f.read()
+        
+        if mm is not None:
+            # Scan straight from the page cache without copying the file into memory
+            with mm:
+                self._check_utf8(mm)
+                yield mm
+            return
+        
+        if not data.isascii():
+            data.decode('utf-8')
+        yield data
+    
+    def _decode_file_bytes(self, data: bytes) -> str:
+        """Decode file bytes as a UTF-8 text-mode read would, translating newlines"""
+        content = data.decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     
     def extract_file_description(self, filename: str, content: str) -> str:
         """Extract or generate appropriate file description"""
-        # Try to extract existing description from comments
-        descriptions = {
-            'arcsec-universal-handler': 'Universal ARCSEC protection and coordination system',
-            'arcsec-master-controller': 'ARCSEC master control and orchestration engine',
-            'arcsec-security': 'Advanced security monitoring and threat detection',
-            'arcsec-safety': 'Safety monitoring, compliance, and risk management system',
-            'arcsec-store': 'Advanced data storage with partitions and caching',
-            'arcsec-bus': 'Message routing and event system with channels',
-            'arcsec-api-management': 'API gateway with rate limiting and monitoring',
-            'arcsec-health-monitor': 'System health monitoring and diagnostics',
-            'arcsec-search-engine': 'Advanced search and knowledge discovery system',
-            'arcsec-memory-recall': 'Knowledge management and context preservation',
-            'arcsec-dev': 'Development environment management and deployment automation',
-            'arcsec_fingerprint': 'Cryptographic file verification and tamper detection system',
-            'arcsec_injector': 'Runtime enforcement and tamper prevention system',
-            'arcsec_manifest_generator': 'Advanced file mapping, hash generation, and metadata collection system'
-        }
+        # Known ARCSEC components first, then a generic description by role
+        match = DESCRIPTION_CLASSIFIER.match(filename.lower())
+        if match:
+            return FILE_DESCRIPTIONS[int(match.lastgroup[1:])][1]
         
-        # Check for known ARCSEC components
-        for component, desc in descriptions.items():
-            if component in filename.lower():
-                return desc
-        
-        # Generate based on file type and name
-        if 'service' in filename.lower():
-            return 'ARCSEC service component'
-        elif 'controller' in filename.lower():
-            return 'ARCSEC control system component'
-        elif 'processor' in filename.lower():
-            return 'ARCSEC data processing component'
-        elif 'engine' in filename.lower():
-            return 'ARCSEC processing engine component'
-        else:
-            return 'ARCSEC system component'
+        return 'ARCSEC system component'
     
     def imprint_signature(self, filepath: str, force: bool = False) -> Dict[str, Any]:
         """Imprint ARCSEC signature on a file"""
@@ -186,19 +317,19 @@ Digital Signature: {self.digital_signature}
             if not os.path.exists(filepath):
                 return {"success": False, "error": "File not found"}
             
+            filename = os.path.basename(filepath)
             file_type = self.get_file_type(filepath)
             if file_type == 'unknown':
-                return {"success": False, "error": f"Unsupported file type: {Path(filepath).suffix}"}
+                return {"success": False, "error": f"Unsupported file type: {file_extension(filename)}"}
             
-            # Read existing content
-            with open(filepath, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            # Read existing content, checking for a signature before decoding it
+            data = self._read_file_bytes(filepath)
             
             # Check if signature already exists
-            if self.has_existing_signature(original_content, file_type) and not force:
+            if self.has_existing_signature(data, file_type) and not force:
                 return {"success": False, "error": "Signature already exists (use force=True to overwrite)"}
             
-            filename = Path(filepath).name
+            original_content = self._decode_file_bytes(data)
             description = self.extract_file_description(filename, original_content)
             
             # Generate signature
@@ -222,23 +353,32 @@ Digital Signature: {self.digital_signature}
             
             signature = signature_generator(filename, description)
             
-            # Remove existing signature if present
-            if self.has_existing_signature(content, file_type):
-                content = self.remove_existing_signature(content, file_type)
+            # Remove existing signature if present. Only the prepended signature
+            # is stripped: the search is bounded to the header window that
+            # detection looks at, so body text mentioning a signature is kept
+            match = SIGNATURE_BLOCKS[file_type].search(content, 0, SIGNATURE_HEADER_SIZE)
+            if file_type in SIGNATURE_PATTERNS:
+                # A signature comment exists exactly when the removal pattern
+                # matches, so the one search both detects and locates it
+                found = match is not None
+            else:
+                found = SIGNATURE_MARKERS[file_type] in content[:SIGNATURE_HEADER_SIZE]
+            
+            if found:
+                if match:
+                    content = content[:match.start()] + content[match.end():]
+                content = content.strip()
             
             # Add new signature at the beginning
-            if file_type in ['python', 'shell'] and content.startswith('#!'):
+            if file_type in ('python', 'shell') and content.startswith('#!'):
                 # Preserve shebang line
-                lines = content.split('\n')
-                shebang = lines[0]
-                rest_content = '\n'.join(lines[1:])
+                shebang, _, rest_content = content.partition('\n')
                 new_content = f"{shebang}\n{signature}\n\n{rest_content.lstrip()}"
             else:
                 new_content = f"{signature}\n\n{content.lstrip()}"
             
             # Write updated content
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            self._replace_file(filepath, new_content)
             
             return {
                 "success": True,
@@ -255,12 +395,20 @@ Digital Signature: {self.digital_signature}
         """Imprint signature on JSON files"""
         try:
             # Parse JSON
-            data = json.loads(content)
+            data, parsed_by_orjson = json_decode(content)
             
             # Add signature metadata
-            filename = Path(filepath).name
+            filename = os.path.basename(filepath)
             signature_metadata = self.get_json_signature(filename, description)
             
+            # Metadata already matching in everything but its timestamp: skip the
+            # full re-serialization a rewrite would cost
+            existing = data.get("_arcsec_metadata") if isinstance(data, dict) else None
+            metadata = signature_metadata["_arcsec_metadata"]
+            if (isinstance(existing, dict) and existing.keys() == metadata.keys()
+                    and all(existing[key] == value for key, value in metadata.items() if key != "created")):
+                return {"success": False, "error": "Signature already exists and is up to date"}
+            
             # If it's already a dict, add metadata at the top
             if isinstance(data, dict):
                 # Create new dict with metadata first
@@ -275,9 +423,9 @@ Digital Signature: {self.digital_signature}
                     "data": data
                 }
             
-            # Write updated JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write updated JSON; orjson would write NaN and Infinity from a
+            # stdlib parse as null
+            self._replace_file(filepath, json_dumps(data, use_orjson=parsed_by_orjson))
             
             return {
                 "success": True,
@@ -292,24 +440,83 @@ Digital Signature: {self.digital_signature}
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def _replace_file(self, filepath: str, content: Union[str, bytes]):
+        """Atomically replace a file's content through a temporary file in the same directory"""
+        # Replace a symlink's target rather than the link, as writing through it did
+        if os.path.islink(filepath):
+            filepath = os.path.realpath(filepath)
+        directory, name = os.path.split(filepath)
+        file_stat = os.stat(filepath)
+        
+        # A rename would split a hard-linked file in two; rewrite it in place
+        # so every link, the owner and any ACLs stay with the new content
+        if file_stat.st_nlink > 1:
+            if isinstance(content, str):
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            else:
+                with open(filepath, 'wb') as f:
+                    f.write(content)
+            return
+        file_mode = stat.S_IMODE(file_stat.st_mode)
+        
+        # Hidden name, so a concurrent scan never picks up the temporary file
+        if isinstance(content, str):
+            tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory or '.',
+                                              prefix=f'.{name}.', suffix='.tmp', delete=False)
+        else:
+            tmp = tempfile.NamedTemporaryFile('wb', dir=directory or '.',
+                                              prefix=f'.{name}.', suffix='.tmp', delete=False)
+        try:
+            with tmp:
+                tmp.write(content)
+            # NamedTemporaryFile creates files owner-only; keep the original permissions
+            os.chmod(tmp.name, file_mode)
+            os.replace(tmp.name, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+    
     def remove_existing_signature(self, content: str, file_type: str) -> str:
         """Remove existing ARCSEC signature from content"""
-        patterns = {
-            'typescript': r'/\*\*[\s\S]*?Digital Signature:[\s\S]*?\*/',
-            'javascript': r'/\*\*[\s\S]*?Digital Signature:[\s\S]*?\*/',
-            'python': r'"""[\s\S]*?Digital Signature:[\s\S]*?"""',
-            'markdown': r'<!--[\s\S]*?Digital Signature:[\s\S]*?-->',
-            'yaml': r'#[^\n]*Digital Signature:[^\n]*\n',
-            'shell': r'#[^\n]*Digital Signature:[^\n]*\n',
-            'sql': r'--[^\n]*Digital Signature:[^\n]*\n'
-        }
-        
-        pattern = patterns.get(file_type)
+        pattern = SIGNATURE_BLOCKS.get(file_type)
         if pattern:
-            content = re.sub(pattern, '', content, flags=re.MULTILINE)
+            content = pattern.sub('', content)
         
         return content.strip()
     
+    def _iter_arcsec_files(self, root_path: str):
+        """Yield ARCSEC file paths in os.walk order, skipping hidden and build directories"""
+        stack = [root_path]
+        while stack:
+            top = stack.pop()
+            try:
+                with os.scandir(top) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                
+                if is_dir:
+                    # Symlinked directories are listed but, like os.walk, not followed
+                    if not name.startswith('.') and name not in SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif "arcsec" in name.lower() and not name.startswith('.'):
+                    yield entry.path
+            
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+    
     def scan_and_imprint(self, root_path: str = ".", pattern: str = "*arcsec*", force: bool = False) -> Dict[str, Any]:
         """Scan directory and imprint signatures on matching files"""
         results = {
@@ -331,48 +538,64 @@ Digital Signature: {self.digital_signature}
         print()
         
         # Find all matching files
-        matching_files = []
-        for root, dirs, files in os.walk(root_path):
-            # Skip hidden and build directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'dist', '__pycache__']]
-            
-            for file in files:
-                if "arcsec" in file.lower() and not file.startswith('.'):
-                    filepath = os.path.join(root, file)
-                    matching_files.append(filepath)
+        matching_files = list(self._iter_arcsec_files(root_path))
         
         results["summary"]["total_files"] = len(matching_files)
         
-        # Process each file
-        for i, filepath in enumerate(matching_files, 1):
-            rel_path = os.path.relpath(filepath, root_path)
-            print(f"📝 Processing [{i}/{len(matching_files)}]: {rel_path}")
-            
-            result = self.imprint_signature(filepath, force=force)
+        # Paths to the same underlying file (symlinks, hard links) are imprinted
+        # serially within one task, so only the first path adds a signature and
+        # the rest report it as already present
+        same_file = defaultdict(list)
+        for filepath in matching_files:
+            try:
+                st = os.stat(filepath)
+                same_file[(st.st_dev, st.st_ino)].append(filepath)
+            except OSError:
+                same_file[filepath].append(filepath)
+        
+        def imprint_group(paths: List[str]) -> List[Dict[str, Any]]:
+            return [self.imprint_signature(filepath, force=force) for filepath in paths]
+        
+        # Rewrites are IO-bound, so overlap them across threads; results and
+        # progress output are still reported in scan order
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(same_file)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            for paths in same_file.values():
+                future = executor.submit(imprint_group, paths)
+                for index, filepath in enumerate(paths):
+                    pending[filepath] = (future, index)
             
-            if result["success"]:
-                results["processed"].append({
-                    "filepath": rel_path,
-                    "file_type": result.get("file_type"),
-                    "signature_added": result.get("signature_added", False)
-                })
-                results["summary"]["signatures_added"] += 1
-                print(f"   ✅ Signature imprinted")
-            else:
-                if "already exists" in result["error"]:
-                    results["skipped"].append({
+            for i, filepath in enumerate(matching_files, 1):
+                rel_path = os.path.relpath(filepath, root_path)
+                print(f"📝 Processing [{i}/{len(matching_files)}]: {rel_path}")
+                
+                future, index = pending[filepath]
+                result = future.result()[index]
+                
+                if result["success"]:
+                    results["processed"].append({
                         "filepath": rel_path,
-                        "reason": result["error"]
+                        "file_type": result.get("file_type"),
+                        "signature_added": result.get("signature_added", False)
                     })
-                    results["summary"]["already_signed"] += 1
-                    print(f"   ⏭️  Skipped: {result['error']}")
+                    results["summary"]["signatures_added"] += 1
+                    print(f"   ✅ Signature imprinted")
                 else:
-                    results["errors"].append({
-                        "filepath": rel_path,
-                        "error": result["error"]
-                    })
-                    results["summary"]["errors"] += 1
-                    print(f"   ❌ Error: {result['error']}")
+                    if "already exists" in result["error"]:
+                        results["skipped"].append({
+                            "filepath": rel_path,
+                            "reason": result["error"]
+                        })
+                        results["summary"]["already_signed"] += 1
+                        print(f"   ⏭️  Skipped: {result['error']}")
+                    else:
+                        results["errors"].append({
+                            "filepath": rel_path,
+                            "error": result["error"]
+                        })
+                        results["summary"]["errors"] += 1
+                        print(f"   ❌ Error: {result['error']}")
         
         return results
     
@@ -392,16 +615,10 @@ Digital Signature: {self.digital_signature}
         }
         
         print(f"🔍 Verifying ARCSEC signatures...")
+        signature = self.digital_signature.encode('utf-8')
         
         # Find all ARCSEC files
-        arcsec_files = []
-        for root, dirs, files in os.walk(root_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'dist', '__pycache__']]
-            
-            for file in files:
-                if "arcsec" in file.lower() and not file.startswith('.'):
-                    filepath = os.path.join(root, file)
-                    arcsec_files.append(filepath)
+        arcsec_files = list(self._iter_arcsec_files(root_path))
         
         verification_results["summary"]["total_arcsec_files"] = len(arcsec_files)
         
@@ -414,12 +631,13 @@ Digital Signature: {self.digital_signature}
                 continue
             
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                with self._file_content(filepath) as content:
+                    has_signature = self.has_existing_signature(content, file_type)
+                    signed = has_signature and content.find(signature, 0, SIGNATURE_HEADER_SIZE) != -1
                 
-                if self.has_existing_signature(content, file_type):
+                if has_signature:
                     # Verify signature is correct
-                    if self.digital_signature in content:
+                    if signed:
                         verification_results["verified"].append({
                             "filepath": rel_path,
                             "file_type": file_type,
@@ -0,0 +1,38 @@
+"""
+Regression tests for the shared ARCSEC helpers
+"""
+
+import math
+import os
+import sys
+from pathlib import PurePath
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'arcsec', 'utilities'))
+
+from arcsec_common import file_extension, json_decode, json_dumps, json_loads
+
+
+def test_json_loads_accepts_what_only_the_stdlib_parses():
+    data = json_loads(b'{"ratio": NaN, "limit": Infinity, "serial": 123456789012345678901234567890}')
+    
+    assert math.isnan(data["ratio"])
+    assert data["limit"] == math.inf
+    assert data["serial"] == 123456789012345678901234567890
+
+
+def test_json_loads_still_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        json_loads(b'{"unterminated": ')
+
+
+def test_stdlib_decoded_data_round_trips():
+    data, parsed_by_orjson = json_decode('{"ratio": NaN}')
+    
+    assert b'NaN' in json_dumps(data, use_orjson=parsed_by_orjson)
+
+
+def test_file_extension_matches_pathlib_suffix():
+    for name in ('arcsec.ts', 'bundle.min.js', '.bashrc', 'notes.', 'README', 'a..b', '..'):
+        assert file_extension(name) == PurePath(name).suffix
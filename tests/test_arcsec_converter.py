@@ -0,0 +1,67 @@
+"""
+Regression tests for the ARCSEC Converter
+"""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'arcsec', 'utilities'))
+
+from arcsec_converter import ARCSECConverter
+
+
+def test_arcsec_to_standard_leaves_the_caller_data_intact():
+    data = {"_arcsec_metadata": {"version": "3.0X"}, "name": "basin"}
+    
+    standard = ARCSECConverter().arcsec_to_standard(data, {})
+    
+    assert standard == {"name": "basin"}
+    assert "_arcsec_metadata" in data
+
+
+def test_arcsec_to_standard_in_place_strips_the_data_itself():
+    data = {"_arcsec_metadata": {"version": "3.0X"}, "name": "basin"}
+    
+    standard = ARCSECConverter().arcsec_to_standard(data, {"in_place": True})
+    
+    assert standard is data
+    assert data == {"name": "basin"}
+
+
+def test_every_conversion_is_callable(tmp_path):
+    converter = ARCSECConverter()
+    assert all(callable(func) for func in converter.conversions.values())
+    
+    source = tmp_path / 'arcsec_gauges.csv'
+    source.write_text('gauge,level\nG1,2.5\n', encoding='utf-8')
+    target = tmp_path / 'gauges.json'
+    
+    result = converter.convert_file(str(source), str(target), 'csv_to_json')
+    
+    assert result["success"]
+    assert target.read_text(encoding='utf-8').startswith('[')
+
+
+def test_supported_conversions_are_a_fresh_dict():
+    converter = ARCSECConverter()
+    conversions = converter.get_supported_conversions()
+    conversions['custom'] = 'Caller-added entry'
+    
+    assert 'custom' not in converter.get_supported_conversions()
+
+
+def test_concurrent_checksums_do_not_share_a_buffer(tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f'arcsec_block_{i}.bin'
+        path.write_bytes(bytes([i]) * (3 << 20))
+        paths.append(str(path))
+    converter = ARCSECConverter()
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        checksums = list(executor.map(converter.calculate_file_checksum, paths * 4))
+    
+    expected = [hashlib.sha256(bytes([i]) * (3 << 20)).hexdigest() for i in range(8)]
+    assert checksums == expected * 4
@@ -0,0 +1,42 @@
+"""
+Regression tests for the ARCSEC Fingerprint
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'arcsec', 'utilities'))
+
+from arcsec_fingerprint import ARCSECFingerprint
+
+
+def _configured_fingerprinter(tmp_path) -> ARCSECFingerprint:
+    """A fingerprinter with every tunable moved off its default"""
+    fingerprinter = ARCSECFingerprint(include_sha512=True)
+    fingerprinter.key_cache_path = tmp_path / 'key.bin'
+    fingerprinter.exact_compression_ratio = True
+    fingerprinter.chunk_size = 4096
+    fingerprinter.compression_sample_size = 1024
+    fingerprinter.small_file_max_size = 0
+    fingerprinter.mmap_min_size = 1 << 30
+    fingerprinter.direct_io_min_size = None
+    return fingerprinter
+
+
+def test_process_pool_fingerprints_match_threads(tmp_path, monkeypatch):
+    for i in range(4):
+        lines = ''.join(f'record {i}:{j} {j * j % 977}\n' for j in range(5000))
+        (tmp_path / f'arcsec_data_{i}.txt').write_text(lines, encoding='utf-8')
+    entries = [(str(path), os.stat(path)) for path in sorted(tmp_path.glob('arcsec_*'))]
+    monkeypatch.setattr(os, 'cpu_count', lambda: 4)
+    
+    fingerprinter = _configured_fingerprinter(tmp_path)
+    fingerprinter.process_pool_min_bytes = 1 << 62
+    threaded = list(fingerprinter._map_fingerprints(entries))
+    fingerprinter.process_pool_min_bytes = 0
+    pooled = list(fingerprinter._map_fingerprints(entries))
+    
+    assert [fp["hashes"] for fp in pooled] == [fp["hashes"] for fp in threaded]
+    assert [fp["hmac_signature"] for fp in pooled] == [fp["hmac_signature"] for fp in threaded]
+    assert [fp["compression_ratio"] for fp in pooled] == [fp["compression_ratio"] for fp in threaded]
+    assert all("sha512" in fp["hashes"] for fp in pooled)
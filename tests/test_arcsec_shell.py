@@ -0,0 +1,27 @@
+"""
+Regression tests for the ARCSEC Shell
+"""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'arcsec', 'utilities'))
+
+from arcsec_shell import ARCSECShell
+
+
+def test_history_tail_reads_only_the_last_entries():
+    shell = ARCSECShell()
+    shell.max_history_length = 3
+    history = b"_HiStOrY_V2_\n" + b"".join(b"cmd %d\n" % i for i in range(100000))
+    
+    assert shell._history_tail(io.BytesIO(history)) == [
+        b"_HiStOrY_V2_\n", b"cmd 99997\n", b"cmd 99998\n", b"cmd 99999\n"]
+
+
+def test_short_history_is_left_to_readline():
+    shell = ARCSECShell()
+    shell.max_history_length = 3
+    
+    assert shell._history_tail(io.BytesIO(b"status\nlist\n")) is None
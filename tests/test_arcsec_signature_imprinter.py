@@ -0,0 +1,98 @@
+"""
+Regression tests for the ARCSEC Signature Imprinter
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'arcsec', 'utilities'))
+
+from arcsec_signature_imprinter import ARCSECSignatureImprinter, SIGNATURE_HEADER_SIZE
+
+
+def _helper_module() -> str:
+    """An unsigned module whose only signature mention is a docstring past the header window"""
+    functions = ''.join(f'def helper_{i}():\n    return {i}\n\n' for i in range(300))
+    late = 'def describe():\n    """Mentions the Digital Signature: field of a header"""\n'
+    return '"""Helper functions."""\n\n' + functions + late
+
+
+def test_late_signature_mention_is_not_stripped(tmp_path):
+    source = _helper_module()
+    assert source.index('Digital Signature:') > SIGNATURE_HEADER_SIZE
+    path = tmp_path / 'arcsec_helper.py'
+    path.write_text(source, encoding='utf-8')
+    
+    result = ARCSECSignatureImprinter().imprint_signature(str(path))
+    
+    assert result["success"]
+    content = path.read_text(encoding='utf-8')
+    assert content.endswith(source)
+    assert content.count('Digital Signature:') == 2
+
+
+def test_force_reimprint_replaces_only_the_header_signature(tmp_path):
+    source = _helper_module()
+    path = tmp_path / 'arcsec_helper.py'
+    path.write_text(source, encoding='utf-8')
+    imprinter = ARCSECSignatureImprinter()
+    imprinter.imprint_signature(str(path))
+    
+    result = imprinter.imprint_signature(str(path), force=True)
+    
+    assert result["success"]
+    content = path.read_text(encoding='utf-8')
+    # Re-imprinting strips surrounding whitespace, including the final newline
+    assert content.endswith(source.rstrip())
+    assert content.count(imprinter.digital_signature) == 1
+
+
+def test_signed_file_is_not_rewritten_without_force(tmp_path):
+    path = tmp_path / 'arcsec_helper.py'
+    path.write_text(_helper_module(), encoding='utf-8')
+    imprinter = ARCSECSignatureImprinter()
+    imprinter.imprint_signature(str(path))
+    signed = path.read_text(encoding='utf-8')
+    
+    result = imprinter.imprint_signature(str(path))
+    
+    assert not result["success"]
+    assert "already exists" in result["error"]
+    assert path.read_text(encoding='utf-8') == signed
+
+
+def test_hard_linked_files_are_signed_once_and_stay_linked(tmp_path):
+    first = tmp_path / 'arcsec_a.ts'
+    first.write_text('export const answer = 42;\n', encoding='utf-8')
+    second = tmp_path / 'arcsec_b.ts'
+    os.link(first, second)
+    
+    results = ARCSECSignatureImprinter().scan_and_imprint(str(tmp_path))
+    
+    assert results["summary"]["signatures_added"] == 1
+    assert results["summary"]["already_signed"] == 1
+    assert os.path.samefile(first, second)
+    assert first.stat().st_nlink == 2
+    assert 'Digital Signature:' in second.read_text(encoding='utf-8')
+
+
+def test_verification_does_not_depend_on_the_read_path(tmp_path):
+    imprinter = ARCSECSignatureImprinter()
+    # A multi-byte character straddling the 1 MiB validation chunks is valid
+    valid = tmp_path / 'arcsec_valid.py'
+    valid.write_text(_helper_module() + '#' * ((1 << 20) - 1 - len(_helper_module())) + 'é\n',
+                     encoding='utf-8')
+    invalid = tmp_path / 'arcsec_invalid.py'
+    invalid.write_text(_helper_module(), encoding='utf-8')
+    for path in (valid, invalid):
+        imprinter.imprint_signature(str(path))
+    with open(invalid, 'ab') as f:
+        f.write(b'# \xff trailing bytes that are not UTF-8\n')
+    
+    read = imprinter.verify_signatures(str(tmp_path))["summary"]
+    imprinter.mmap_min_size = 0
+    mapped = imprinter.verify_signatures(str(tmp_path))["summary"]
+    
+    assert read == mapped
+    assert mapped["properly_signed"] == 1
+    assert mapped["invalid_signatures"] == 1